@@ -30,7 +30,9 @@ target_metadata = Base.metadata
 # Get database URL and schema from settings
 settings = get_settings()
 config.set_main_option("sqlalchemy.url", str(settings.database_url))
-SCHEMA = settings.database_schema
+# `alembic -x schema=<name> upgrade head` targets another (tenant) schema; the
+# revisions read it back from the context opts.
+SCHEMA = context.get_x_argument(as_dictionary=True).get("schema", settings.database_schema)
 
 
 def run_migrations_offline() -> None:
@@ -43,6 +45,7 @@ def run_migrations_offline() -> None:
         dialect_opts={"paramstyle": "named"},
         include_schemas=True,
         version_table_schema=SCHEMA,
+        schema=SCHEMA,
     )
 
     with context.begin_transaction():
@@ -62,14 +65,19 @@ def run_migrations_online() -> None:
         connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA}"))
         connection.commit()
 
-        # Set search path
+        # Set search path (session-level, so it survives the commit). Committing
+        # here leaves no implicit transaction open, letting Alembic own the
+        # migration transactions — required for autocommit_block() batches.
         connection.execute(text(f"SET search_path TO {SCHEMA}, public"))
+        connection.commit()
 
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
             include_schemas=True,
             version_table_schema=SCHEMA,
+            schema=SCHEMA,
+            transaction_per_migration=True,
         )
 
         with context.begin_transaction():
@@ -7,7 +7,7 @@ Create Date: 2026-01-14
 """
 from typing import Sequence, Union
 
-from alembic import op
+from alembic import context, op
 import sqlalchemy as sa
 
 
@@ -18,89 +18,101 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+# Instance rows backfilled per autocommitted UPDATE on pre-11 servers.
+BACKFILL_BATCH_SIZE = 1000
+
+# NOT NULL columns carrying a constant server default: (name, type, default).
+DEFAULTED_COLUMNS = [
+    ("display_width", "INTEGER", "800"),
+    ("display_height", "INTEGER", "480"),
+    ("display_bit_depth", "INTEGER", "1"),
+    ("is_initialized", "BOOLEAN", "false"),
+    ("is_ready", "BOOLEAN", "false"),
+    ("needs_configuration", "BOOLEAN", "true"),
+]
+
+
 def upgrade() -> None:
     """Add LLSS callback URLs, display capabilities, and state fields to instances."""
     # Get the schema name from context (defaults to 'lichess')
     schema = op.get_context().opts.get('schema', 'lichess')
-    
-    # LLSS callback URLs
-    op.add_column(
-        'instances',
-        sa.Column('callback_frames', sa.String(512), nullable=True),
-        schema=schema
-    )
-    op.add_column(
-        'instances',
-        sa.Column('callback_inputs', sa.String(512), nullable=True),
-        schema=schema
-    )
-    op.add_column(
-        'instances',
-        sa.Column('callback_notify', sa.String(512), nullable=True),
-        schema=schema
-    )
-    
-    # Display capabilities
-    op.add_column(
-        'instances',
-        sa.Column('display_width', sa.Integer(), nullable=False, server_default='800'),
-        schema=schema
-    )
-    op.add_column(
-        'instances',
-        sa.Column('display_height', sa.Integer(), nullable=False, server_default='480'),
-        schema=schema
-    )
-    op.add_column(
-        'instances',
-        sa.Column('display_bit_depth', sa.Integer(), nullable=False, server_default='1'),
-        schema=schema
-    )
-    
-    # Instance state
-    op.add_column(
-        'instances',
-        sa.Column('is_initialized', sa.Boolean(), nullable=False, server_default='false'),
-        schema=schema
-    )
-    op.add_column(
-        'instances',
-        sa.Column('is_ready', sa.Boolean(), nullable=False, server_default='false'),
-        schema=schema
-    )
-    op.add_column(
-        'instances',
-        sa.Column('needs_configuration', sa.Boolean(), nullable=False, server_default='true'),
-        schema=schema
+
+    # Postgres 11+ stores a constant default as catalog metadata, so NOT NULL
+    # DEFAULT columns are added without touching existing rows. Older servers
+    # rewrite the table under the exclusive lock; there the columns are added
+    # nullable, backfilled in batches, and only then constrained.
+    server_version = None
+    if not context.is_offline_mode():
+        server_version = op.get_bind().dialect.server_version_info
+    fast_default = server_version is None or server_version >= (11,)
+
+    if fast_default:
+        defaulted = [
+            f"ADD COLUMN {name} {type_} NOT NULL DEFAULT {default}"
+            for name, type_, default in DEFAULTED_COLUMNS
+        ]
+    else:
+        defaulted = [f"ADD COLUMN {name} {type_}" for name, type_, _ in DEFAULTED_COLUMNS]
+
+    # One ALTER TABLE for every column and the FK: the AccessExclusiveLock is
+    # taken once and the catalog rewritten once, instead of per column.
+    columns = ",\n            ".join(
+        [
+            "ADD COLUMN callback_frames VARCHAR(512)",
+            "ADD COLUMN callback_inputs VARCHAR(512)",
+            "ADD COLUMN callback_notify VARCHAR(512)",
+            *defaulted,
+            "ADD COLUMN configuration_url VARCHAR(512)",
+            "ADD COLUMN linked_account_id VARCHAR(36)",
+            "ADD COLUMN last_frame_id VARCHAR(36)",
+        ]
     )
-    op.add_column(
-        'instances',
-        sa.Column('configuration_url', sa.String(512), nullable=True),
-        schema=schema
+    op.execute(
+        f"""
+        ALTER TABLE {schema}.instances
+            {columns},
+            ADD CONSTRAINT fk_instances_linked_account
+                FOREIGN KEY (linked_account_id) REFERENCES {schema}.lichess_accounts (id)
+        """
     )
-    
-    # Linked account
-    op.add_column(
-        'instances',
-        sa.Column('linked_account_id', sa.String(36), nullable=True),
-        schema=schema
+
+    if not fast_default:
+        _backfill_defaulted_columns(schema)
+
+
+def _backfill_defaulted_columns(schema: str) -> None:
+    """Add-nullable / backfill / SET NOT NULL for servers without fast defaults.
+
+    Defaults are attached first (metadata only) so rows inserted during the
+    backfill are already filled; existing rows are then updated in batches that
+    each commit on their own, and NOT NULL is enforced in one final ALTER.
+    """
+    set_defaults = ",\n            ".join(
+        f"ALTER COLUMN {name} SET DEFAULT {default}" for name, _, default in DEFAULTED_COLUMNS
     )
-    op.create_foreign_key(
-        'fk_instances_linked_account',
-        'instances',
-        'lichess_accounts',
-        ['linked_account_id'],
-        ['id'],
-        source_schema=schema,
-        referent_schema=schema
+    op.execute(f"ALTER TABLE {schema}.instances\n            {set_defaults}")
+
+    assignments = ", ".join(f"{name} = {default}" for name, _, default in DEFAULTED_COLUMNS)
+    backfill_batch = sa.text(
+        f"""
+        UPDATE {schema}.instances SET {assignments}
+        WHERE id IN (
+            SELECT id FROM {schema}.instances
+            WHERE display_width IS NULL
+            ORDER BY id
+            LIMIT :batch_size
+        )
+        """
     )
-    
-    # Last frame tracking
-    op.add_column(
-        'instances',
-        sa.Column('last_frame_id', sa.String(36), nullable=True),
-        schema=schema
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        while bind.execute(backfill_batch, {"batch_size": BACKFILL_BATCH_SIZE}).rowcount:
+            pass
+
+    set_not_null = ",\n            ".join(
+        f"ALTER COLUMN {name} SET NOT NULL" for name, _, _ in DEFAULTED_COLUMNS
     )
+    op.execute(f"ALTER TABLE {schema}.instances\n            {set_not_null}")
 
 
 def downgrade() -> None:
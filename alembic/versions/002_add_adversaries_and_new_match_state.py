@@ -32,7 +32,10 @@ def upgrade() -> None:
         "adversaries",
         sa.Column("id", sa.String(36), primary_key=True),
         sa.Column(
-            "account_id", sa.String(36), sa.ForeignKey("lichess_accounts.id"), nullable=False
+            "account_id",
+            sa.String(36),
+            sa.ForeignKey("lichess_accounts.id", name="fk_adversaries_account_id"),
+            nullable=False,
         ),
         sa.Column("lichess_username", sa.String(255), nullable=False),
         sa.Column("friendly_name", sa.String(255), nullable=False),
@@ -44,8 +47,15 @@ def upgrade() -> None:
             server_default=sa.func.now(),
             onupdate=sa.func.now(),
         ),
+        # Postgres does not index FK columns; joins and cascades from
+        # lichess_accounts would otherwise scan adversaries.
+        sa.Index("ix_adversaries_account_id", "account_id"),
         schema=schema,
+        # The table is empty here: build it (and its indexes) without WAL, then
+        # make it durable before anything can be written to it.
+        prefixes=["UNLOGGED"],
     )
+    op.execute(f"ALTER TABLE {schema}.adversaries SET LOGGED")
 
 
 def downgrade() -> None:
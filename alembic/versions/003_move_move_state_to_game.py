@@ -8,7 +8,7 @@ Create Date: 2026-01-22
 
 import sqlalchemy as sa
 
-from alembic import op
+from alembic import context, op
 
 # revision identifiers, used by Alembic.
 revision = "003_move_move_state_to_game"
@@ -16,26 +16,119 @@ down_revision = "002_add_adversaries_and_new_match_state"
 branch_labels = None
 depends_on = None
 
+# Instances copied per autocommitted UPDATE batch during the backfill.
+BACKFILL_BATCH_SIZE = 500
+
 
 def upgrade() -> None:
     schema = op.get_context().opts.get("schema", "lichess")
 
-    op.add_column(
-        "games",
-        sa.Column("move_state", sa.Text(), nullable=True),
-        schema=schema,
-    )
+    # IF NOT EXISTS so a run that failed after this statement committed (the
+    # autocommit blocks below commit it) can simply be re-run.
+    op.execute(f"ALTER TABLE {schema}.games ADD COLUMN IF NOT EXISTS move_state TEXT")
 
-    op.execute(
+    # Temporary partial index over just the rows to copy: each keyset page (and
+    # the offline single UPDATE's join) becomes an index range scan instead of
+    # filtering every instance. Built and dropped CONCURRENTLY, which Postgres
+    # only allows outside a transaction block.
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS tmp_ix_instances_move_state_backfill
+            ON {schema}.instances (id, current_game_id)
+            WHERE move_state IS NOT NULL
+            """
+        )
+
+    if context.is_offline_mode():
+        # No bind to page through when emitting SQL scripts; keep the single UPDATE.
+        op.execute(
+            f"""
+            UPDATE {schema}.games
+            SET move_state = inst.move_state
+            FROM {schema}.instances AS inst
+            WHERE games.id = inst.current_game_id AND inst.move_state IS NOT NULL
+            """
+        )
+    else:
+        with op.get_context().autocommit_block():
+            # Every copied row is rewritten, so each games index would be
+            # maintained row by row; drop the non-unique ones right before the
+            # copy and rebuild them once afterwards, even if the copy fails.
+            # Unique indexes stay since they enforce invariants during the copy.
+            games_index_defs = _drop_secondary_indexes(schema, "games")
+            try:
+                _backfill_games_move_state(schema)
+            finally:
+                for index_def in games_index_defs:
+                    op.execute(
+                        index_def.replace(
+                            "CREATE INDEX", "CREATE INDEX CONCURRENTLY IF NOT EXISTS", 1
+                        )
+                    )
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"DROP INDEX CONCURRENTLY IF EXISTS {schema}.tmp_ix_instances_move_state_backfill"
+        )
+
+    op.drop_column("instances", "move_state", schema=schema)
+
+
+def _drop_secondary_indexes(schema: str, table: str) -> list[str]:
+    """Drop the non-unique indexes on a table and return their definitions.
+
+    Must run inside an autocommit block (DROP INDEX CONCURRENTLY).
+    """
+    rows = op.get_bind().execute(
+        sa.text(
+            """
+            SELECT idx.relname AS name, pg_get_indexdef(i.indexrelid) AS definition
+            FROM pg_index AS i
+            JOIN pg_class AS idx ON idx.oid = i.indexrelid
+            JOIN pg_class AS tbl ON tbl.oid = i.indrelid
+            JOIN pg_namespace AS ns ON ns.oid = tbl.relnamespace
+            WHERE ns.nspname = :schema AND tbl.relname = :table AND NOT i.indisunique
+            """
+        ),
+        {"schema": schema, "table": table},
+    ).all()
+    for row in rows:
+        op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {schema}."{row.name}"')
+    return [row.definition for row in rows]
+
+
+def _backfill_games_move_state(schema: str) -> None:
+    """Copy instances.move_state onto the current game in keyset-paged batches.
+
+    Must run inside an autocommit block: each batch then commits on its own,
+    so a large table never holds row locks or WAL for the whole copy in one
+    transaction.
+    """
+    select_batch = sa.text(
         f"""
-        UPDATE {schema}.games
-        SET move_state = inst.move_state
-        FROM {schema}.instances AS inst
-        WHERE games.id = inst.current_game_id AND inst.move_state IS NOT NULL
+        SELECT id, current_game_id, move_state
+        FROM {schema}.instances
+        WHERE move_state IS NOT NULL AND current_game_id IS NOT NULL AND id > :last_id
+        ORDER BY id
+        LIMIT :batch_size
         """
     )
+    update_game = sa.text(f"UPDATE {schema}.games SET move_state = :move_state WHERE id = :game_id")
 
-    op.drop_column("instances", "move_state", schema=schema)
+    bind = op.get_bind()
+    last_id = ""
+    while True:
+        rows = bind.execute(
+            select_batch, {"last_id": last_id, "batch_size": BACKFILL_BATCH_SIZE}
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            update_game,
+            [{"move_state": row.move_state, "game_id": row.current_game_id} for row in rows],
+        )
+        last_id = rows[-1].id
 
 
 def downgrade() -> None:
@@ -0,0 +1,90 @@
+"""Add indexes on hot lookup columns
+
+Covers the default-account reset (partial index on is_default), the
+per-account active-games query (account_id, status), instance lookups by
+linked account and the adversaries FK column. Built CONCURRENTLY so live tables are not write-locked.
+
+Revision ID: 009_add_hot_lookup_indexes
+Revises: 008_add_frame_full_refresh
+Create Date: 2026-10-16
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+revision = "009_add_hot_lookup_indexes"
+down_revision = "008_add_frame_full_refresh"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    schema = op.get_context().opts.get("schema", "lichess")
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_accounts_is_default",
+            "lichess_accounts",
+            ["is_default"],
+            schema=schema,
+            postgresql_where=sa.text("is_default"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_games_account_status",
+            "games",
+            ["account_id", "status"],
+            schema=schema,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_instances_linked_account",
+            "instances",
+            ["linked_account_id"],
+            schema=schema,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Created by 002 on fresh databases; backfills ones migrated before
+        # 002 declared it.
+        op.create_index(
+            "ix_adversaries_account_id",
+            "adversaries",
+            ["account_id"],
+            schema=schema,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    schema = op.get_context().opts.get("schema", "lichess")
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_instances_linked_account",
+            table_name="instances",
+            schema=schema,
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_games_account_status",
+            table_name="games",
+            schema=schema,
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_accounts_is_default",
+            table_name="lichess_accounts",
+            schema=schema,
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,74 @@
+"""Store UUID keys as native uuid instead of varchar(36)
+
+Every primary key and the columns that reference them held hyphenated UUID
+text. The native type is 16 bytes, so the PK/FK btrees shrink by more than
+half. Foreign keys are dropped around the type change (both ends of a
+constraint must agree on the type) and recreated under their existing names.
+
+Revision ID: 010_use_native_uuid_keys
+Revises: 009_add_hot_lookup_indexes
+Create Date: 2026-10-16
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+revision = "010_use_native_uuid_keys"
+down_revision = "009_add_hot_lookup_indexes"
+branch_labels = None
+depends_on = None
+
+
+UUID_COLUMNS = {
+    "lichess_accounts": ["id"],
+    "games": ["id", "account_id", "match_id", "instance_id"],
+    "lichess_challenges": ["id", "account_id"],
+    "frames": ["id", "game_id"],
+    "input_events": ["id"],
+    "instances": ["id", "current_game_id", "linked_account_id", "last_frame_id"],
+    "adversaries": ["id", "account_id"],
+}
+
+
+def upgrade() -> None:
+    _convert_uuid_columns("uuid USING {column}::uuid")
+
+
+def downgrade() -> None:
+    _convert_uuid_columns("varchar(36) USING {column}::text")
+
+
+def _convert_uuid_columns(type_clause: str) -> None:
+    schema = op.get_context().opts.get("schema", "lichess")
+    inspector = sa.inspect(op.get_bind())
+
+    foreign_keys = [
+        (table, fk)
+        for table in UUID_COLUMNS
+        for fk in inspector.get_foreign_keys(table, schema=schema)
+    ]
+    for table, fk in foreign_keys:
+        op.drop_constraint(fk["name"], table, type_="foreignkey", schema=schema)
+
+    # One ALTER per table so each table is rewritten once, not once per column.
+    for table, columns in UUID_COLUMNS.items():
+        alterations = ", ".join(
+            f"ALTER COLUMN {column} TYPE {type_clause.format(column=column)}"
+            for column in columns
+        )
+        op.execute(f"ALTER TABLE {schema}.{table} {alterations}")
+
+    for table, fk in foreign_keys:
+        op.create_foreign_key(
+            fk["name"],
+            table,
+            fk["referred_table"],
+            fk["constrained_columns"],
+            fk["referred_columns"],
+            source_schema=schema,
+            referent_schema=fk["referred_schema"] or schema,
+            **fk["options"],
+        )
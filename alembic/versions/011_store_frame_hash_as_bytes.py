@@ -0,0 +1,43 @@
+"""Store Frame.image_hash as the raw 32-byte digest
+
+The SHA-256 was kept as 64 hex characters. bytea halves it, and the API
+hex-encodes on the way out so the wire format is unchanged.
+
+Revision ID: 011_store_frame_hash_as_bytes
+Revises: 010_use_native_uuid_keys
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+
+
+revision = "011_store_frame_hash_as_bytes"
+down_revision = "010_use_native_uuid_keys"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    schema = op.get_context().opts.get("schema", "lichess")
+
+    op.execute(
+        f"ALTER TABLE {schema}.frames "
+        "ALTER COLUMN image_hash TYPE bytea USING decode(image_hash, 'hex')"
+    )
+    op.create_check_constraint(
+        "ck_frames_image_hash_length",
+        "frames",
+        "length(image_hash) = 32",
+        schema=schema,
+    )
+
+
+def downgrade() -> None:
+    schema = op.get_context().opts.get("schema", "lichess")
+
+    op.drop_constraint("ck_frames_image_hash_length", "frames", type_="check", schema=schema)
+    op.execute(
+        f"ALTER TABLE {schema}.frames "
+        "ALTER COLUMN image_hash TYPE varchar(64) USING encode(image_hash, 'hex')"
+    )
@@ -0,0 +1,35 @@
+"""Store Game.move_state as jsonb
+
+move_state held JSON text that was parsed in Python on every read. jsonb
+keeps the parsed form on disk and the engine's JSON (de)serializer handles
+the conversion.
+
+Revision ID: 012_store_move_state_as_jsonb
+Revises: 011_store_frame_hash_as_bytes
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+
+
+revision = "012_store_move_state_as_jsonb"
+down_revision = "011_store_frame_hash_as_bytes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    schema = op.get_context().opts.get("schema", "lichess")
+
+    op.execute(
+        f"ALTER TABLE {schema}.games ALTER COLUMN move_state TYPE jsonb USING move_state::jsonb"
+    )
+
+
+def downgrade() -> None:
+    schema = op.get_context().opts.get("schema", "lichess")
+
+    op.execute(
+        f"ALTER TABLE {schema}.games ALTER COLUMN move_state TYPE text USING move_state::text"
+    )
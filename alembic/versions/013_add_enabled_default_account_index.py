@@ -0,0 +1,49 @@
+"""Add index for picking the default enabled account
+
+Instance initialization links the first enabled account ordered by
+is_default DESC; this partial index serves that ORDER BY ... LIMIT 1.
+
+Revision ID: 013_add_enabled_default_account_index
+Revises: 012_store_move_state_as_jsonb
+Create Date: 2026-10-16
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+revision = "013_add_enabled_default_account_index"
+down_revision = "012_store_move_state_as_jsonb"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    schema = op.get_context().opts.get("schema", "lichess")
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_accounts_enabled_default",
+            "lichess_accounts",
+            [sa.text("is_default DESC")],
+            schema=schema,
+            postgresql_where=sa.text("is_enabled"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    schema = op.get_context().opts.get("schema", "lichess")
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_accounts_enabled_default",
+            table_name="lichess_accounts",
+            schema=schema,
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,36 @@
+"""Store Instance.new_match_state as jsonb
+
+Like games.move_state, new_match_state held JSON text that was parsed on
+every new-match render and button press; jsonb hands back the parsed form.
+
+Revision ID: 014_store_new_match_state_as_jsonb
+Revises: 013_add_enabled_default_account_index
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+
+
+revision = "014_store_new_match_state_as_jsonb"
+down_revision = "013_add_enabled_default_account_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    schema = op.get_context().opts.get("schema", "lichess")
+
+    op.execute(
+        f"ALTER TABLE {schema}.instances "
+        "ALTER COLUMN new_match_state TYPE jsonb USING new_match_state::jsonb"
+    )
+
+
+def downgrade() -> None:
+    schema = op.get_context().opts.get("schema", "lichess")
+
+    op.execute(
+        f"ALTER TABLE {schema}.instances "
+        "ALTER COLUMN new_match_state TYPE text USING new_match_state::text"
+    )
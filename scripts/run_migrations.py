@@ -0,0 +1,103 @@
+"""Upgrade every tenant schema that is behind head, several at a time.
+
+Each schema with an alembic_version table is a candidate; schemas already at
+head are skipped. The rest are upgraded in batches, each schema in its own
+worker process running `alembic -x schema=<name> upgrade head`.
+
+    python scripts/run_migrations.py [--workers 6] [--batch-size 50] [schema ...]
+"""
+
+import argparse
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from hlss.config import get_settings
+
+logger = logging.getLogger("run_migrations")
+
+ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
+SLOW_BATCH_SECONDS = 60.0
+
+
+def _alembic_config(schema: str | None = None) -> Config:
+    config = Config(str(ALEMBIC_INI))
+    if schema is not None:
+        config.cmd_opts = argparse.Namespace(x=[f"schema={schema}"])
+    return config
+
+
+def _pending_schemas(head: str, only: list[str]) -> list[str]:
+    """Schemas with an alembic_version table whose version is not head."""
+    engine = create_engine(str(get_settings().database_url))
+    with engine.connect() as connection:
+        schemas = connection.scalars(
+            text(
+                """
+                SELECT n.nspname
+                FROM pg_namespace AS n
+                JOIN pg_class AS c ON c.relnamespace = n.oid
+                WHERE c.relname = 'alembic_version' AND c.relkind = 'r'
+                ORDER BY n.nspname
+                """
+            )
+        ).all()
+        if only:
+            schemas = [schema for schema in schemas if schema in only]
+        pending = [
+            schema
+            for schema in schemas
+            if connection.scalar(text(f'SELECT version_num FROM "{schema}".alembic_version'))
+            != head
+        ]
+    engine.dispose()
+    return pending
+
+
+def _upgrade(schema: str) -> str:
+    command.upgrade(_alembic_config(schema), "head")
+    return schema
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=6)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("schemas", nargs="*", help="Limit to these schemas")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    head = ScriptDirectory.from_config(_alembic_config()).get_current_head()
+    pending = _pending_schemas(head, args.schemas)
+    logger.info("%d schema(s) below head %s", len(pending), head)
+
+    failed: list[str] = []
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for start in range(0, len(pending), args.batch_size):
+            batch = pending[start : start + args.batch_size]
+            started = time.monotonic()
+            futures = {pool.submit(_upgrade, schema): schema for schema in batch}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception:
+                    logger.exception("Upgrade failed for schema %s", futures[future])
+                    failed.append(futures[future])
+            elapsed = time.monotonic() - started
+            log = logger.warning if elapsed > SLOW_BATCH_SECONDS else logger.info
+            batch_number = start // args.batch_size + 1
+            log("Batch %d: %d schema(s) in %.1fs", batch_number, len(batch), elapsed)
+
+    if failed:
+        raise SystemExit(f"{len(failed)} schema(s) failed: {', '.join(sorted(failed))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,12 @@
 Database configuration and session management.
 """
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
+from typing import Any, Final
 
-from sqlalchemy import create_engine, event, text
+import orjson
+from sqlalchemy import create_engine, inspect, make_url, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 from sqlalchemy.schema import CreateSchema
 
@@ -13,30 +16,45 @@ from hlss.config import get_settings
 
 settings = get_settings()
 
+# Plain module globals for values read on hot paths (no settings attribute lookup).
+DATABASE_SCHEMA: Final[str] = settings.database_schema
+
+
+def _json_dumps(value: Any) -> str:
+    """orjson for JSON/JSONB binds; the DBAPI wants str, orjson returns bytes."""
+    return orjson.dumps(value).decode()
+
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
 
     # Set the schema for all models
-    __table_args__ = {"schema": settings.database_schema}
+    __table_args__ = {"schema": DATABASE_SCHEMA}
 
 
 engine = create_engine(
     str(settings.database_url),
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    pool_pre_ping=settings.database_pool_pre_ping,
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_max_overflow,
+    pool_timeout=settings.database_pool_timeout_seconds,
+    pool_recycle=settings.database_pool_recycle_seconds,
+    query_cache_size=settings.database_query_cache_size,
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
+    connect_args={
+        # libpq applies the search path from the startup packet, so new
+        # connections don't pay an extra SET round-trip.
+        "options": f"-csearch_path={DATABASE_SCHEMA},public",
+        # Keepalives surface dead peers without a per-checkout pre-ping.
+        "keepalives": 1,
+        "keepalives_idle": 30,
+        "keepalives_interval": 10,
+        "keepalives_count": 5,
+    },
 )
 
 
-@event.listens_for(engine, "connect")
-def set_search_path(dbapi_connection, connection_record):
-    """Set the search path to use the configured schema."""
-    cursor = dbapi_connection.cursor()
-    cursor.execute(f"SET search_path TO {settings.database_schema}, public")
-    cursor.close()
-
-
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -49,10 +67,40 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+# asyncpg engine for read-only endpoints that are polled often: they await the
+# database on the event loop instead of holding a threadpool worker each.
+async_engine = create_async_engine(
+    make_url(str(settings.database_url)).set(drivername="postgresql+asyncpg"),
+    pool_pre_ping=settings.database_pool_pre_ping,
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_max_overflow,
+    pool_timeout=settings.database_pool_timeout_seconds,
+    pool_recycle=settings.database_pool_recycle_seconds,
+    query_cache_size=settings.database_query_cache_size,
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
+    connect_args={
+        "server_settings": {"search_path": f"{DATABASE_SCHEMA},public"},
+        # Statements are prepared once per connection and reused while they
+        # stay in this per-connection LRU.
+        "prepared_statement_cache_size": settings.database_prepared_statement_cache_size,
+    },
+)
+
+# Nothing is lazy-loaded under asyncio, so keep loaded state after commit.
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for getting async database sessions."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def ensure_schema_exists() -> None:
     """Create the schema if it doesn't exist."""
     with engine.connect() as conn:
-        conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {settings.database_schema}"))
+        conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {DATABASE_SCHEMA}"))
         conn.commit()
 
 
@@ -60,7 +108,9 @@ def init_db() -> None:
     """Initialize database schema and tables."""
     # First ensure the schema exists
     ensure_schema_exists()
-    # Then create all tables
-    Base.metadata.create_all(bind=engine)
-    """Initialize database tables."""
-    Base.metadata.create_all(bind=engine)
+    # Then create only the missing tables: one reflection query up front instead
+    # of create_all's per-table existence check on every start.
+    existing = set(inspect(engine).get_table_names(schema=DATABASE_SCHEMA))
+    missing = [table for table in Base.metadata.sorted_tables if table.name not in existing]
+    if missing:
+        Base.metadata.create_all(bind=engine, tables=missing, checkfirst=False)
@@ -4,14 +4,16 @@ HLSS - High Level Screen Service for Lichess e-Ink Client
 FastAPI application entry point.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
+from typing import Final
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from hlss import __version__
 from hlss.config import get_settings
-from hlss.database import init_db
+from hlss.database import async_engine, init_db
 from hlss.routers import (
     accounts_router,
     configure_router,
@@ -20,24 +22,33 @@ from hlss.routers import (
     inputs_router,
     instances_router,
 )
+from hlss.routers.instances import start_render_workers, stop_render_workers
 from hlss.schemas import HealthResponse
+from hlss.services.llss import close_shared_client, open_shared_client
 
 settings = get_settings()
 
+IS_DEV: Final[bool] = settings.is_development
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler for startup/shutdown."""
     # Startup
-    if settings.is_development:
-        # Auto-create tables in development
-        init_db()
+    if IS_DEV:
+        # Auto-create tables in development (sync engine; keep it off the loop)
+        await asyncio.to_thread(init_db)
+    await open_shared_client()
+    await start_render_workers()
     yield
+    await stop_render_workers()
     # Shutdown: tear down the persistent Stockfish process (its engine thread is
     # non-daemon, so close it for a clean reload/exit).
     from hlss.services.local_engine import local_engine
 
     local_engine.close()
+    await close_shared_client()
+    await async_engine.dispose()
 
 
 app = FastAPI(
@@ -60,7 +71,7 @@ All UI rendering is performed on the server using Pillow and python-chess.
 # CORS middleware for web configuration interface
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"] if settings.is_development else [],
+    allow_origins=["*"] if IS_DEV else [],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
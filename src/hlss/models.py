@@ -5,22 +5,29 @@ SQLAlchemy models for the HLSS application.
 import enum
 from datetime import datetime
 from typing import Optional
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from sqlalchemy import (
+    JSON,
     Boolean,
+    CheckConstraint,
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     LargeBinary,
     String,
     Text,
+    TypeDecorator,
+    Uuid,
     func,
+    text,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from hlss.database import Base
+from hlss.database import DATABASE_SCHEMA, Base
 
 
 def generate_uuid() -> str:
@@ -28,12 +35,56 @@ def generate_uuid() -> str:
     return str(uuid4())
 
 
+def is_uuid(value: object) -> bool:
+    """Whether ``value`` is accepted by UUID key columns.
+
+    Routes check ids taken from the request with this and answer 404 for
+    anything else, since binding a malformed id raises.
+    """
+    try:
+        UUID(str(value))
+    except ValueError:
+        return False
+    return True
+
+
+class UUIDString(TypeDecorator[str]):
+    """Native 16-byte uuid column that still reads and writes plain strings.
+
+    A value that is not a UUID raises on bind rather than being stored or
+    matched as something else.
+    """
+
+    impl = Uuid(as_uuid=False)
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return str(UUID(str(value)))
+
+
+UUID_TYPE = UUIDString()
+
+
 class LichessAccount(Base):
     """A Lichess account linked to the HLSS instance."""
 
     __tablename__ = "lichess_accounts"
+    __table_args__ = (
+        # At most a handful of rows are default; the default-reset UPDATE only
+        # has to visit those.
+        Index("ix_accounts_is_default", "is_default", postgresql_where=text("is_default")),
+        # Instance init links the first enabled account, default first.
+        Index(
+            "ix_accounts_enabled_default",
+            text("is_default DESC"),
+            postgresql_where=text("is_enabled"),
+        ),
+        {"schema": DATABASE_SCHEMA},
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
+    id: Mapped[str] = mapped_column(UUID_TYPE, primary_key=True, default=generate_uuid)
     username: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     api_token: Mapped[Optional[str]] = mapped_column(
         Text, nullable=True
@@ -50,7 +101,8 @@ class LichessAccount(Base):
     )
     last_games_sync_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
-    # Relationships
+    # Relationships. Collections stay lazy: an account's game history is
+    # unbounded, so callers that need children opt in with selectinload().
     games: Mapped[list["Game"]] = relationship("Game", back_populates="account")
     challenges: Mapped[list["LichessChallenge"]] = relationship(
         "LichessChallenge",
@@ -89,28 +141,39 @@ class GameColor(enum.Enum):
     BLACK = "black"
 
 
+# Column types are built once and shared by every mapping. The explicit names
+# pin the native Postgres enum types create_all already emitted (SQLAlchemy's
+# implicit lowercase class name), so existing databases need no migration.
+GAME_STATUS_ENUM = Enum(GameStatus, name="gamestatus", native_enum=True)
+GAME_COLOR_ENUM = Enum(GameColor, name="gamecolor", native_enum=True)
+
+
 class Game(Base):
     """A Lichess game being tracked by HLSS."""
 
     __tablename__ = "games"
+    __table_args__ = (
+        Index("ix_games_account_status", "account_id", "status"),
+        {"schema": DATABASE_SCHEMA},
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
+    id: Mapped[str] = mapped_column(UUID_TYPE, primary_key=True, default=generate_uuid)
     # For local games this is a synthetic "local-<uuid>" id (col is unique+not-null).
     lichess_game_id: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
-    account_id: Mapped[str] = mapped_column(String(36), ForeignKey("lichess.lichess_accounts.id"))
+    account_id: Mapped[str] = mapped_column(UUID_TYPE, ForeignKey("lichess.lichess_accounts.id"))
     # "lichess" or "local" — selects the GameBackend that drives this game.
     backend: Mapped[str] = mapped_column(
         String(16), nullable=False, default="lichess", server_default="lichess"
     )
     # Local human-vs-human: the two mirrored rows of one match share match_id, and
     # each row's instance_id is the HLSS instance that plays that side (for frame relay).
-    match_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)
-    instance_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)
+    match_id: Mapped[Optional[str]] = mapped_column(UUID_TYPE, nullable=True)
+    instance_id: Mapped[Optional[str]] = mapped_column(UUID_TYPE, nullable=True)
 
     # Game metadata
-    player_color: Mapped[GameColor] = mapped_column(Enum(GameColor), nullable=False)
+    player_color: Mapped[GameColor] = mapped_column(GAME_COLOR_ENUM, nullable=False)
     opponent_username: Mapped[str] = mapped_column(String(255), nullable=True)
-    status: Mapped[GameStatus] = mapped_column(Enum(GameStatus), default=GameStatus.CREATED)
+    status: Mapped[GameStatus] = mapped_column(GAME_STATUS_ENUM, default=GameStatus.CREATED)
     is_my_turn: Mapped[bool] = mapped_column(Boolean, default=False)
 
     # Game state
@@ -123,7 +186,10 @@ class Game(Base):
     raw_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     last_move: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
     moves: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Space-separated UCI moves
-    move_state: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Serialized MoveState; jsonb on Postgres (plain JSON elsewhere, e.g. tests).
+    move_state: Mapped[Optional[dict]] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"), nullable=True
+    )
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
@@ -133,6 +199,7 @@ class Game(Base):
 
     # Relationships
     account: Mapped["LichessAccount"] = relationship("LichessAccount", back_populates="games")
+    # Lazy on purpose: frames carry the rendered image blobs.
     frames: Mapped[list["Frame"]] = relationship("Frame", back_populates="game")
 
 
@@ -141,9 +208,9 @@ class LichessChallenge(Base):
 
     __tablename__ = "lichess_challenges"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
+    id: Mapped[str] = mapped_column(UUID_TYPE, primary_key=True, default=generate_uuid)
     lichess_challenge_id: Mapped[str] = mapped_column(String(32), unique=True, nullable=False)
-    account_id: Mapped[str] = mapped_column(String(36), ForeignKey("lichess.lichess_accounts.id"))
+    account_id: Mapped[str] = mapped_column(UUID_TYPE, ForeignKey("lichess.lichess_accounts.id"))
 
     # Challenge metadata
     challenger_username: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
@@ -180,21 +247,29 @@ class ScreenType(enum.Enum):
     GAME_LIST = "game_list"  # List of ongoing games
 
 
+SCREEN_TYPE_ENUM = Enum(ScreenType, name="screentype", native_enum=True)
+
+
 class Frame(Base):
     """A rendered frame stored by HLSS."""
 
     __tablename__ = "frames"
+    __table_args__ = (
+        # length() of a blob is its byte count on both Postgres and SQLite.
+        CheckConstraint("length(image_hash) = 32", name="ck_frames_image_hash_length"),
+        {"schema": DATABASE_SCHEMA},
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
+    id: Mapped[str] = mapped_column(UUID_TYPE, primary_key=True, default=generate_uuid)
     game_id: Mapped[Optional[str]] = mapped_column(
-        String(36), ForeignKey("lichess.games.id"), nullable=True
+        UUID_TYPE, ForeignKey("lichess.games.id"), nullable=True
     )
 
-    screen_type: Mapped[ScreenType] = mapped_column(Enum(ScreenType), nullable=False)
+    screen_type: Mapped[ScreenType] = mapped_column(SCREEN_TYPE_ENUM, nullable=False)
 
     # Frame data
     image_data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
-    image_hash: Mapped[str] = mapped_column(String(64), nullable=False)  # SHA256 hash
+    image_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False)  # raw SHA256 digest
     width: Mapped[int] = mapped_column(Integer, nullable=False)
     height: Mapped[int] = mapped_column(Integer, nullable=False)
 
@@ -258,19 +333,27 @@ class ButtonType(enum.Enum):
     HL_RIGHT = "HL_RIGHT"
 
 
+BUTTON_TYPE_ENUM = Enum(ButtonType, name="buttontype", native_enum=True)
+INPUT_EVENT_TYPE_ENUM = Enum(InputEventType, name="inputeventtype", native_enum=True)
+
+
 class InputEvent(Base):
     """Record of input events received from devices."""
 
     __tablename__ = "input_events"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    button: Mapped[ButtonType] = mapped_column(Enum(ButtonType), nullable=False)
-    event_type: Mapped[InputEventType] = mapped_column(Enum(InputEventType), nullable=False)
+    id: Mapped[str] = mapped_column(UUID_TYPE, primary_key=True, default=generate_uuid)
+    button: Mapped[ButtonType] = mapped_column(BUTTON_TYPE_ENUM, nullable=False)
+    event_type: Mapped[InputEventType] = mapped_column(INPUT_EVENT_TYPE_ENUM, nullable=False)
     event_timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False)
 
     # Processing info
     processed: Mapped[bool] = mapped_column(Boolean, default=False)
-    processed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # Stamped by the database, like created_at: the only UPDATE an event ever
+    # gets is the one marking it processed.
+    processed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True, onupdate=func.now()
+    )
 
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
@@ -279,8 +362,12 @@ class Instance(Base):
     """HLSS instance registered with LLSS."""
 
     __tablename__ = "instances"
+    __table_args__ = (
+        Index("ix_instances_linked_account", "linked_account_id"),
+        {"schema": DATABASE_SCHEMA},
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
+    id: Mapped[str] = mapped_column(UUID_TYPE, primary_key=True, default=generate_uuid)
     llss_instance_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, unique=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     instance_type: Mapped[str] = mapped_column(String(50), default="chess")
@@ -302,19 +389,21 @@ class Instance(Base):
     configuration_url: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
 
     # Current state
-    current_screen: Mapped[ScreenType] = mapped_column(Enum(ScreenType), default=ScreenType.SETUP)
-    current_game_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)
+    current_screen: Mapped[ScreenType] = mapped_column(SCREEN_TYPE_ENUM, default=ScreenType.SETUP)
+    current_game_id: Mapped[Optional[str]] = mapped_column(UUID_TYPE, nullable=True)
 
     # Linked Lichess account
     linked_account_id: Mapped[Optional[str]] = mapped_column(
-        String(36), ForeignKey("lichess.lichess_accounts.id"), nullable=True
+        UUID_TYPE, ForeignKey("lichess.lichess_accounts.id"), nullable=True
     )
 
-    # Navigation state for move input
-    new_match_state: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # New-match screen selection; jsonb on Postgres (plain JSON elsewhere).
+    new_match_state: Mapped[Optional[dict]] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"), nullable=True
+    )
 
     # Last frame tracking
-    last_frame_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)
+    last_frame_id: Mapped[Optional[str]] = mapped_column(UUID_TYPE, nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
@@ -331,9 +420,13 @@ class Adversary(Base):
     """A Lichess friend/adversary associated with an account."""
 
     __tablename__ = "adversaries"
+    __table_args__ = (
+        Index("ix_adversaries_account_id", "account_id"),
+        {"schema": DATABASE_SCHEMA},
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    account_id: Mapped[str] = mapped_column(String(36), ForeignKey("lichess.lichess_accounts.id"))
+    id: Mapped[str] = mapped_column(UUID_TYPE, primary_key=True, default=generate_uuid)
+    account_id: Mapped[str] = mapped_column(UUID_TYPE, ForeignKey("lichess.lichess_accounts.id"))
     lichess_username: Mapped[str] = mapped_column(String(255), nullable=False)
     friendly_name: Mapped[str] = mapped_column(String(255), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
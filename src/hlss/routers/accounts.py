@@ -5,11 +5,11 @@ API routes for Lichess account management.
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, insert, select, update
 from sqlalchemy.orm import Session
 
 from hlss.database import get_db
-from hlss.models import LichessAccount
+from hlss.models import LichessAccount, is_uuid
 from hlss.schemas import (
     LichessAccountCreate,
     LichessAccountResponse,
@@ -20,6 +20,30 @@ router = APIRouter(prefix="/accounts", tags=["accounts"])
 
 DbSession = Annotated[Session, Depends(get_db)]
 
+# Advisory lock key held while an account is made the default.
+_DEFAULT_ACCOUNT_LOCK_KEY = 0x686C7373  # "hlss"
+
+# Built once at import; only the bound username changes per request.
+_ACCOUNT_BY_USERNAME = select(LichessAccount).where(
+    LichessAccount.username == bindparam("username")
+)
+
+
+def _clear_default_accounts(db: Session) -> None:
+    """Unset is_default on every account in a single UPDATE.
+
+    A transaction-scoped advisory lock makes concurrent default flips run one
+    after another, including when no account is default yet and there is no
+    row to lock. SQLite (tests) has a single writer and skips it.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(select(func.pg_advisory_xact_lock(_DEFAULT_ACCOUNT_LOCK_KEY)))
+    db.execute(
+        update(LichessAccount)
+        .where(LichessAccount.is_default.is_(True))
+        .values(is_default=False)
+    )
+
 
 @router.get("", response_model=list[LichessAccountResponse])
 def list_accounts(db: DbSession) -> list[LichessAccount]:
@@ -31,7 +55,7 @@ def list_accounts(db: DbSession) -> list[LichessAccount]:
 @router.get("/{account_id}", response_model=LichessAccountResponse)
 def get_account(account_id: str, db: DbSession) -> LichessAccount:
     """Get a specific Lichess account."""
-    account = db.get(LichessAccount, account_id)
+    account = db.get(LichessAccount, account_id) if is_uuid(account_id) else None
     if not account:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -41,10 +65,10 @@ def get_account(account_id: str, db: DbSession) -> LichessAccount:
 
 
 @router.post("", response_model=LichessAccountResponse, status_code=status.HTTP_201_CREATED)
-def create_account(data: LichessAccountCreate, db: DbSession) -> LichessAccount:
+def create_account(data: LichessAccountCreate, db: DbSession) -> LichessAccountResponse:
     """Create a new Lichess account configuration."""
     # Check if username already exists
-    existing = db.scalar(select(LichessAccount).where(LichessAccount.username == data.username))
+    existing = db.scalar(_ACCOUNT_BY_USERNAME, {"username": data.username})
     if existing:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -53,21 +77,22 @@ def create_account(data: LichessAccountCreate, db: DbSession) -> LichessAccount:
 
     # If this is the first account or marked as default, ensure only one default
     if data.is_default:
-        db.execute(select(LichessAccount).where(LichessAccount.is_default == True))  # noqa: E712
-        for acc in db.scalars(
-            select(LichessAccount).where(LichessAccount.is_default == True)  # noqa: E712
-        ).all():
-            acc.is_default = False
-
-    account = LichessAccount(
-        username=data.username,
-        api_token=data.api_token,
-        is_default=data.is_default,
-    )
-    db.add(account)
+        _clear_default_accounts(db)
+
+    # RETURNING hands back the server-filled timestamps with the INSERT itself;
+    # the response is built before commit expires the instance.
+    account = db.scalars(
+        insert(LichessAccount)
+        .values(
+            username=data.username,
+            api_token=data.api_token,
+            is_default=data.is_default,
+        )
+        .returning(LichessAccount)
+    ).one()
+    response = LichessAccountResponse.model_validate(account)
     db.commit()
-    db.refresh(account)
-    return account
+    return response
 
 
 @router.patch("/{account_id}", response_model=LichessAccountResponse)
@@ -75,10 +100,9 @@ def update_account(
     account_id: str,
     data: LichessAccountUpdate,
     db: DbSession,
-) -> LichessAccount:
+) -> LichessAccountResponse:
     """Update a Lichess account configuration."""
-    account = db.get(LichessAccount, account_id)
-    if not account:
+    if not is_uuid(account_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Account not found",
@@ -88,23 +112,36 @@ def update_account(
 
     # Handle default account logic
     if update_data.get("is_default"):
-        for acc in db.scalars(
-            select(LichessAccount).where(LichessAccount.is_default == True)  # noqa: E712
-        ).all():
-            acc.is_default = False
-
-    for field, value in update_data.items():
-        setattr(account, field, value)
+        _clear_default_accounts(db)
+
+    # The UPDATE doubles as the existence check, and RETURNING reloads the row
+    # (including the bumped updated_at) without a follow-up SELECT.
+    if update_data:
+        stmt = (
+            update(LichessAccount)
+            .where(LichessAccount.id == account_id)
+            .values(**update_data)
+            .returning(LichessAccount)
+        )
+    else:
+        stmt = select(LichessAccount).where(LichessAccount.id == account_id)
+    account = db.scalars(stmt).one_or_none()
+    if not account:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Account not found",
+        )
 
+    response = LichessAccountResponse.model_validate(account)
     db.commit()
-    db.refresh(account)
-    return account
+    return response
 
 
 @router.delete("/{account_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_account(account_id: str, db: DbSession) -> None:
     """Delete a Lichess account configuration."""
-    account = db.get(LichessAccount, account_id)
+    account = db.get(LichessAccount, account_id) if is_uuid(account_id) else None
     if not account:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -2,42 +2,52 @@
 API routes for frame management.
 """
 
-from typing import Annotated
+from typing import Annotated, Any, cast
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.responses import Response
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import CursorResult, delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, defer
 
-from hlss.database import get_db
-from hlss.models import Frame
+from hlss.database import get_async_db, get_db
+from hlss.models import Frame, is_uuid
 from hlss.schemas import FrameResponse
 
 router = APIRouter(prefix="/frames", tags=["frames"])
 
 DbSession = Annotated[Session, Depends(get_db)]
+AsyncDbSession = Annotated[AsyncSession, Depends(get_async_db)]
 
 
 @router.get("", response_model=list[FrameResponse])
-def list_frames(
-    db: DbSession,
+async def list_frames(
+    db: AsyncDbSession,
     game_id: str | None = None,
     limit: int = 10,
 ) -> list[Frame]:
     """List recent frames, optionally filtered by game."""
-    stmt = select(Frame)
+    if game_id and not is_uuid(game_id):
+        return []
+
+    # Metadata only: the PNG blobs are not part of FrameResponse.
+    stmt = select(Frame).options(
+        defer(Frame.image_data),
+        defer(Frame.top_pressed_data),
+        defer(Frame.bottom_pressed_data),
+    )
 
     if game_id:
         stmt = stmt.where(Frame.game_id == game_id)
 
     stmt = stmt.order_by(Frame.created_at.desc()).limit(limit)
-    return list(db.scalars(stmt).all())
+    return list((await db.scalars(stmt)).all())
 
 
 @router.get("/{frame_id}", response_model=FrameResponse)
 def get_frame(frame_id: str, db: DbSession) -> Frame:
     """Get frame metadata by ID."""
-    frame = db.get(Frame, frame_id)
+    frame = db.get(Frame, frame_id) if is_uuid(frame_id) else None
     if not frame:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -47,8 +57,31 @@ def get_frame(frame_id: str, db: DbSession) -> Frame:
 
 
 @router.get("/{frame_id}/image")
-def get_frame_image(frame_id: str, db: DbSession) -> Response:
-    """Get the raw frame image data."""
+def get_frame_image(frame_id: str, db: DbSession, request: Request) -> Response:
+    """Get the raw frame image data.
+
+    Frames are content-addressed by their SHA-256, so the hash doubles as a
+    strong ETag: a matching If-None-Match gets a 304 without reading the blob.
+    """
+    if not is_uuid(frame_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Frame not found",
+        )
+
+    image_hash = db.scalar(select(Frame.image_hash).where(Frame.id == frame_id))
+    if image_hash is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Frame not found",
+        )
+
+    etag = f'"{image_hash.hex()}"'
+    cache_headers = {"ETag": etag, "Cache-Control": "public, max-age=3600, immutable"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
     frame = db.get(Frame, frame_id)
     if not frame:
         raise HTTPException(
@@ -60,7 +93,8 @@ def get_frame_image(frame_id: str, db: DbSession) -> Response:
         content=frame.image_data,
         media_type="image/png",
         headers={
-            "X-Frame-Hash": frame.image_hash,
+            **cache_headers,
+            "X-Frame-Hash": frame.image_hash.hex(),
             "X-Frame-Width": str(frame.width),
             "X-Frame-Height": str(frame.height),
         },
@@ -70,12 +104,18 @@ def get_frame_image(frame_id: str, db: DbSession) -> Response:
 @router.delete("/{frame_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_frame(frame_id: str, db: DbSession) -> None:
     """Delete a frame."""
-    frame = db.get(Frame, frame_id)
-    if not frame:
+    if not is_uuid(frame_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Frame not found",
         )
 
-    db.delete(frame)
+    # The DELETE doubles as the existence check; no row is loaded.
+    result = cast(CursorResult[Any], db.execute(delete(Frame).where(Frame.id == frame_id)))
+    if result.rowcount == 0:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Frame not found",
+        )
     db.commit()
@@ -2,28 +2,36 @@
 API routes for game management.
 """
 
-from typing import Annotated
+from typing import Annotated, Any, cast
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import CursorResult, bindparam, delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from hlss.database import get_db
-from hlss.models import Game, GameStatus, LichessAccount
+from hlss.database import get_async_db, get_db
+from hlss.models import Frame, Game, GameStatus, LichessAccount, is_uuid
 from hlss.schemas import GameCreate, GameListResponse, GameResponse
 
 router = APIRouter(prefix="/games", tags=["games"])
 
 DbSession = Annotated[Session, Depends(get_db)]
+AsyncDbSession = Annotated[AsyncSession, Depends(get_async_db)]
+
+# Built once at import; only the bound Lichess id changes per request.
+_GAME_BY_LICHESS_ID = select(Game).where(Game.lichess_game_id == bindparam("lichess_game_id"))
 
 
 @router.get("", response_model=GameListResponse)
-def list_games(
-    db: DbSession,
+async def list_games(
+    db: AsyncDbSession,
     account_id: str | None = None,
     active_only: bool = True,
 ) -> dict:
     """List games, optionally filtered by account and status."""
+    if account_id and not is_uuid(account_id):
+        return {"games": [], "total": 0}
+
     stmt = select(Game)
 
     if account_id:
@@ -35,7 +43,7 @@ def list_games(
         stmt = stmt.where(Game.status.in_(active_statuses))
 
     stmt = stmt.order_by(Game.updated_at.desc())
-    games = list(db.scalars(stmt).all())
+    games = list((await db.scalars(stmt)).all())
 
     return {"games": games, "total": len(games)}
 
@@ -43,7 +51,7 @@ def list_games(
 @router.get("/{game_id}", response_model=GameResponse)
 def get_game(game_id: str, db: DbSession) -> Game:
     """Get a specific game by ID."""
-    game = db.get(Game, game_id)
+    game = db.get(Game, game_id) if is_uuid(game_id) else None
     if not game:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -55,7 +63,7 @@ def get_game(game_id: str, db: DbSession) -> Game:
 @router.get("/lichess/{lichess_game_id}", response_model=GameResponse)
 def get_game_by_lichess_id(lichess_game_id: str, db: DbSession) -> Game:
     """Get a game by its Lichess game ID."""
-    game = db.scalar(select(Game).where(Game.lichess_game_id == lichess_game_id))
+    game = db.scalar(_GAME_BY_LICHESS_ID, {"lichess_game_id": lichess_game_id})
     if not game:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -73,7 +81,7 @@ def create_game(data: GameCreate, db: DbSession) -> Game:
     The actual game creation is handled by the Lichess service.
     """
     # Verify account exists
-    account = db.get(LichessAccount, data.account_id)
+    account = db.get(LichessAccount, data.account_id) if is_uuid(data.account_id) else None
     if not account:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -97,12 +105,20 @@ def create_game(data: GameCreate, db: DbSession) -> Game:
 @router.delete("/{game_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_game(game_id: str, db: DbSession) -> None:
     """Remove a game from tracking (does not affect Lichess)."""
-    game = db.get(Game, game_id)
-    if not game:
+    if not is_uuid(game_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Game not found",
         )
 
-    db.delete(game)
+    # Detach the game's frames as the ORM delete did, then delete the game
+    # directly; the DELETE doubles as the existence check.
+    db.execute(update(Frame).where(Frame.game_id == game_id).values(game_id=None))
+    result = cast(CursorResult[Any], db.execute(delete(Game).where(Game.id == game_id)))
+    if result.rowcount == 0:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Game not found",
+        )
     db.commit()
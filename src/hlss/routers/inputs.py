@@ -2,21 +2,27 @@
 API routes for handling input events from LLSS.
 """
 
-from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from hlss.database import get_db
 from hlss.models import InputEvent as InputEventModel
-from hlss.models import ButtonType, InputEventType
+from hlss.models import ButtonType, InputEventType, is_uuid
+from hlss.schemas import ButtonType as SchemaButtonType
 from hlss.schemas import InputEventCreate, InputEventResponse
+from hlss.schemas import InputEventType as SchemaInputEventType
 
 router = APIRouter(prefix="/inputs", tags=["inputs"])
 
 DbSession = Annotated[Session, Depends(get_db)]
 
+# Validated request enums map straight to their model members.
+_BUTTON_TYPES = {member: ButtonType(member.value) for member in SchemaButtonType}
+_EVENT_TYPES = {member: InputEventType(member.value) for member in SchemaInputEventType}
+
 
 @router.post("", response_model=InputEventResponse, status_code=status.HTTP_202_ACCEPTED)
 def receive_input_event(data: InputEventCreate, db: DbSession) -> InputEventModel:
@@ -27,8 +33,8 @@ def receive_input_event(data: InputEventCreate, db: DbSession) -> InputEventMode
     The event is stored and processed asynchronously by the input processing service.
     """
     event = InputEventModel(
-        button=ButtonType(data.button.value),
-        event_type=InputEventType(data.event_type.value),
+        button=_BUTTON_TYPES[data.button],
+        event_type=_EVENT_TYPES[data.event_type],
         event_timestamp=data.timestamp,
         processed=False,
     )
@@ -43,20 +49,28 @@ def receive_input_event(data: InputEventCreate, db: DbSession) -> InputEventMode
 
 
 @router.post("/process/{event_id}", response_model=InputEventResponse)
-def mark_event_processed(event_id: str, db: DbSession) -> InputEventModel:
+def mark_event_processed(event_id: str, db: DbSession) -> InputEventResponse:
     """Mark an input event as processed (internal use)."""
-    from fastapi import HTTPException
+    if not is_uuid(event_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Event not found",
+        )
 
-    event = db.get(InputEventModel, event_id)
+    # A single UPDATE ... RETURNING both checks existence and reloads the row.
+    event = db.scalars(
+        update(InputEventModel)
+        .where(InputEventModel.id == event_id)
+        .values(processed=True)
+        .returning(InputEventModel)
+    ).one_or_none()
     if not event:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found",
         )
 
-    event.processed = True
-    event.processed_at = datetime.utcnow()
+    response = InputEventResponse.model_validate(event)
     db.commit()
-    db.refresh(event)
-
-    return event
+    return response
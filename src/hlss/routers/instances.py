@@ -5,19 +5,33 @@ Implements the HLSS OpenAPI specification for instance lifecycle,
 input handling, and frame rendering.
 """
 
+import asyncio
 import hashlib
-import json
+import logging
 import re
-from datetime import datetime
-from typing import Annotated, Optional
-
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from datetime import datetime, timezone
+from functools import cache, lru_cache
+from typing import Annotated, Any, Callable, Final, Optional, cast
+from uuid import UUID
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from sqlalchemy import CursorResult, Row, bindparam, delete, func, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, raiseload
 
 from hlss.config import get_settings
-from hlss.database import get_db
+from hlss.database import SessionLocal, get_async_db, get_db
 from hlss.models import (
+    Adversary,
     ButtonType,
     Frame,
     Game,
@@ -27,8 +41,11 @@ from hlss.models import (
     LichessAccount,
     LichessChallenge,
     ScreenType,
+    generate_uuid,
+    is_uuid,
 )
 from hlss.models import InputEvent as InputEventModel
+from hlss.schemas import ButtonType as SchemaButtonType
 from hlss.schemas import (
     FrameMetadataResponse,
     FrameSendResponse,
@@ -43,16 +60,35 @@ from hlss.schemas import (
     MoveState,
     RenderResponse,
 )
+from hlss.schemas import InputEventType as SchemaInputEventType
 from hlss.security import require_llss_auth
+from hlss.services import refresh_state, view_state
 from hlss.services.backends import is_local, local_backend
+from hlss.services.game_stream import game_stream_manager
 from hlss.services.input_processor import InputProcessorService
 from hlss.services.lichess import LichessService
+from hlss.services.llss import LLSSService
+from hlss.services.new_match_state import (
+    ai_adversary_label,
+    ai_level_from_id,
+    load_new_match_state,
+)
 from hlss.services.renderer import RendererService
 
 router = APIRouter(prefix="/instances", tags=["instances"])
 
 DbSession = Annotated[Session, Depends(get_db)]
+AsyncDbSession = Annotated[AsyncSession, Depends(get_async_db)]
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+_CONFIG_URL_PREFIX: Final[str] = f"{settings.public_url}/configure/"
+
+# Validated request enums map straight to their model members.
+_BUTTON_TYPES = {member: ButtonType(member.value) for member in SchemaButtonType}
+_EVENT_TYPES = {member: InputEventType(member.value) for member in SchemaInputEventType}
+# Raw screen names (query string) to members, without Enum's lookup machinery.
+_SCREEN_TYPES = {member.value: member for member in ScreenType}
 
 _UCI_MOVE_PATTERN = re.compile(r"^[a-h][1-8][a-h][1-8][qrbn]?$", re.IGNORECASE)
 
@@ -61,6 +97,60 @@ def _is_uci_move(value: str) -> bool:
     return bool(_UCI_MOVE_PATTERN.match(value))
 
 
+# Every LLSS callback resolves its instance through the unique
+# llss_instance_id index; the statement is built once at import.
+_INSTANCE_BY_LLSS_ID = select(Instance).where(
+    Instance.llss_instance_id == bindparam("llss_instance_id")
+)
+
+# The status poll and frame-metadata poll read a handful of columns; plain
+# rows skip ORM hydration and, for frames, never touch the image blobs.
+_INSTANCE_STATUS_BY_LLSS_ID = select(
+    Instance.is_ready,
+    Instance.needs_configuration,
+    Instance.configuration_url,
+    Instance.current_screen,
+    Instance.current_game_id,
+).where(Instance.llss_instance_id == bindparam("llss_instance_id"))
+_FRAME_METADATA_BY_ID = select(
+    Frame.id,
+    Frame.llss_frame_id,
+    Frame.image_hash,
+    Frame.screen_type,
+    Frame.width,
+    Frame.height,
+    Frame.created_at,
+).where(Frame.id == bindparam("frame_id"))
+
+# Render/send requests only need the instance's keys, not a hydrated row.
+_INSTANCE_KEYS_BY_LLSS_ID = select(Instance.id, Instance.last_frame_id).where(
+    Instance.llss_instance_id == bindparam("llss_instance_id")
+)
+
+
+def _get_instance_or_404(db: Session, instance_id: str) -> Instance:
+    """Load the instance LLSS knows as ``instance_id`` or raise 404."""
+    instance = db.scalar(_INSTANCE_BY_LLSS_ID, {"llss_instance_id": instance_id})
+    if not instance:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Instance not found: {instance_id}",
+        )
+    return instance
+
+
+async def _get_instance_keys_or_404(db: AsyncSession, instance_id: str) -> Row:
+    """Load (id, last_frame_id) of the instance LLSS knows as ``instance_id`` or raise 404."""
+    result = await db.execute(_INSTANCE_KEYS_BY_LLSS_ID, {"llss_instance_id": instance_id})
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Instance not found: {instance_id}",
+        )
+    return row
+
+
 # ============================================================================
 # HLSS OpenAPI Endpoints (called by LLSS)
 # ============================================================================
@@ -82,9 +172,9 @@ def initialize_instance(
     This is the main entry point for LLSS to set up communication with HLSS.
     """
     # Check if instance already exists with this LLSS ID
-    stmt = select(Instance).where(Instance.llss_instance_id == data.instance_id)
-    existing = db.scalars(stmt).first()
+    existing = db.scalar(_INSTANCE_BY_LLSS_ID, {"llss_instance_id": data.instance_id})
 
+    # All mutations below land in a single commit at the end.
     if existing:
         # Update existing instance with new callbacks
         existing.callback_frames = data.callbacks.frames
@@ -94,13 +184,13 @@ def initialize_instance(
         existing.display_height = data.display.height
         existing.display_bit_depth = data.display.bit_depth
         existing.is_initialized = True
-        existing.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(existing)
+        existing.updated_at = func.now()
         instance = existing
     else:
-        # Create new instance
+        # Create new instance; the id is generated up front so the
+        # configuration URL can be built without a flush.
         instance = Instance(
+            id=generate_uuid(),
             llss_instance_id=data.instance_id,
             name=f"Lichess Instance {data.instance_id[:8]}",
             instance_type="chess",
@@ -116,38 +206,44 @@ def initialize_instance(
             current_screen=ScreenType.SETUP,
         )
         db.add(instance)
-        db.commit()
-        db.refresh(instance)
 
-    # Check if we have any configured Lichess accounts
-    accounts = db.scalars(select(LichessAccount).where(LichessAccount.is_enabled == True)).all()
+    # Link the default enabled account (or any enabled one) if we have one;
+    # the database picks it and only its id is fetched.
+    default_account_id = db.execute(
+        select(LichessAccount.id)
+        .where(LichessAccount.is_enabled == True)
+        .order_by(LichessAccount.is_default.desc())
+        .limit(1)
+    ).scalar_one_or_none()
 
-    if accounts:
+    if default_account_id:
         # If we have accounts, mark as ready
         instance.is_ready = True
         instance.needs_configuration = False
         instance.current_screen = ScreenType.NEW_MATCH
-        # Link to default account if available
-        default_account = next((a for a in accounts if a.is_default), accounts[0])
-        instance.linked_account_id = default_account.id
-        db.commit()
-        db.refresh(instance)
+        instance.linked_account_id = default_account_id
 
     # Generate configuration URL
-    config_url = f"{settings.public_url}/configure/{instance.id}"
+    config_url = _CONFIG_URL_PREFIX + instance.id
     instance.configuration_url = config_url
+
+    # Read what the response needs before commit expires the instance.
+    instance_id = instance.id
+    needs_configuration = instance.needs_configuration
     db.commit()
 
-    # Queue initial frame render
+    # Queue initial frame render; a re-registering LLSS may have lost its
+    # frames, so the upload is not skipped.
     background_tasks.add_task(
-        _render_and_submit_frame,
-        instance_id=instance.id,
+        _schedule_render,
+        instance_id=instance_id,
+        resubmit=True,
     )
 
     return InstanceInitResponse(
         status="initialized",
-        needs_configuration=instance.needs_configuration,
-        configuration_url=config_url if instance.needs_configuration else None,
+        needs_configuration=needs_configuration,
+        configuration_url=config_url if needs_configuration else None,
     )
 
 
@@ -172,26 +268,7 @@ def receive_instance_input(
 
     The instance_id is the LLSS-assigned instance ID.
     """
-    # Find instance by LLSS instance ID
-    stmt = select(Instance).where(Instance.llss_instance_id == instance_id)
-    instance = db.scalars(stmt).first()
-
-    if not instance:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Instance not found: {instance_id}",
-        )
-
-    # Store the input event
-    event = InputEventModel(
-        button=ButtonType(data.button.value),
-        event_type=InputEventType(data.event_type.value),
-        event_timestamp=data.timestamp,
-        processed=False,
-    )
-    db.add(event)
-    db.commit()
-    db.refresh(event)
+    instance = _get_instance_or_404(db, instance_id)
 
     # Process the input event synchronously.
     # In PLAY, LONG_PRESS on the top app-buttons is reserved for game
@@ -213,7 +290,7 @@ def receive_instance_input(
     else:
         state_changed, move_or_error = processor.process_button(
             instance=instance,
-            button=ButtonType(data.button.value),
+            button=_BUTTON_TYPES[data.button],
         )
 
     move_uci: Optional[str] = None
@@ -241,7 +318,6 @@ def receive_instance_input(
                 # Local backend: apply our move + (for an AI game) Stockfish's
                 # reply, synchronously. No network.
                 local_backend.submit_move(db, game, move_uci)
-                from hlss.services import refresh_state
                 refresh_state.mark(instance.id)
             else:
                 lichess_service = LichessService(game.account.api_token)
@@ -257,7 +333,6 @@ def receive_instance_input(
                     # arrives via the realtime game stream.
                     processor.apply_local_move(game, move_uci)
                     db.commit()
-                    from hlss.services import refresh_state
                     refresh_state.mark(instance.id)
 
     # Keep a realtime Board stream open for the active game so the opponent's
@@ -273,17 +348,23 @@ def receive_instance_input(
                 and _game.account
                 and _game.account.api_token
             ):
-                from hlss.services.game_stream import game_stream_manager
-
                 game_stream_manager.ensure_stream(
                     instance.id, _game.lichess_game_id, _game.account.api_token
                 )
     except Exception:
         pass
 
-    # Mark event as processed
-    event.processed = True
-    event.processed_at = datetime.utcnow()
+    # Processing is synchronous, so the event is stored once, already marked
+    # processed, instead of being inserted up front and updated here.
+    db.add(
+        InputEventModel(
+            button=_BUTTON_TYPES[data.button],
+            event_type=_EVENT_TYPES[data.event_type],
+            event_timestamp=data.timestamp,
+            processed=True,
+            processed_at=func.now(),
+        )
+    )
     db.commit()
 
     if error_message:
@@ -292,8 +373,6 @@ def receive_instance_input(
     if state_changed:
         # Render and submit immediately so LLSS can respond with a frame ID.
         try:
-            import asyncio
-
             frame_id = asyncio.run(_render_and_submit_frame(instance_id=instance.id))
         except Exception:
             frame_id = None
@@ -318,9 +397,9 @@ def receive_instance_input(
     response_model=InstanceStatusResponse,
     tags=["hlss-api"],
 )
-def get_instance_status(
+async def get_instance_status(
     instance_id: str,
-    db: DbSession,
+    db: AsyncDbSession,
     _: dict = Depends(require_llss_auth),
 ) -> InstanceStatusResponse:
     """
@@ -331,26 +410,24 @@ def get_instance_status(
 
     The instance_id is the LLSS-assigned instance ID.
     """
-    # Find instance by LLSS instance ID
-    stmt = select(Instance).where(Instance.llss_instance_id == instance_id)
-    instance = db.scalars(stmt).first()
-
-    if not instance:
+    result = await db.execute(_INSTANCE_STATUS_BY_LLSS_ID, {"llss_instance_id": instance_id})
+    row = result.one_or_none()
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Instance not found: {instance_id}",
         )
 
     # Determine active screen name
-    active_screen = instance.current_screen.value
-    if instance.current_game_id:
-        active_screen = f"game_{instance.current_game_id}"
+    active_screen = row.current_screen.value
+    if row.current_game_id:
+        active_screen = f"game_{row.current_game_id}"
 
     return InstanceStatusResponse(
         instance_id=instance_id,
-        ready=instance.is_ready,
-        needs_configuration=instance.needs_configuration,
-        configuration_url=instance.configuration_url if instance.needs_configuration else None,
+        ready=row.is_ready,
+        needs_configuration=row.needs_configuration,
+        configuration_url=row.configuration_url if row.needs_configuration else None,
         active_screen=active_screen,
     )
 
@@ -361,10 +438,10 @@ def get_instance_status(
     status_code=status.HTTP_202_ACCEPTED,
     tags=["hlss-api", "rendering"],
 )
-def force_render(
+async def force_render(
     instance_id: str,
     background_tasks: BackgroundTasks,
-    db: DbSession,
+    db: AsyncDbSession,
     _: dict = Depends(require_llss_auth),
 ) -> RenderResponse:
     """
@@ -375,20 +452,13 @@ def force_render(
 
     The instance_id is the LLSS-assigned instance ID.
     """
-    # Find instance by LLSS instance ID
-    stmt = select(Instance).where(Instance.llss_instance_id == instance_id)
-    instance = db.scalars(stmt).first()
-
-    if not instance:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Instance not found: {instance_id}",
-        )
+    instance = await _get_instance_keys_or_404(db, instance_id)
 
     # Queue a render task
     background_tasks.add_task(
-        _render_and_submit_frame,
+        _schedule_render,
         instance_id=instance.id,
+        resubmit=True,
     )
 
     return RenderResponse(
@@ -404,6 +474,7 @@ def force_render(
 )
 def get_frame_metadata(
     instance_id: str,
+    background_tasks: BackgroundTasks,
     db: DbSession,
     _: dict = Depends(require_llss_auth),
 ) -> FrameMetadataResponse:
@@ -412,19 +483,12 @@ def get_frame_metadata(
 
     Returns metadata about the current frame for this instance,
     including frame ID, hash, dimensions, and screen type.
-    LLSS can use this to check if it has the latest frame.
+    LLSS can use this to check if it has the latest frame. If no frame
+    exists yet, one is rendered in the background and has_frame is False.
 
     The instance_id is the LLSS-assigned instance ID.
     """
-    # Find instance by LLSS instance ID
-    stmt = select(Instance).where(Instance.llss_instance_id == instance_id)
-    instance = db.scalars(stmt).first()
-
-    if not instance:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Instance not found: {instance_id}",
-        )
+    instance = _get_instance_or_404(db, instance_id)
 
     # Check if we have a frame - if not, render one first
     # If there is a current game, sync its state first and re-render if status changed
@@ -453,7 +517,7 @@ def get_frame_metadata(
                     # (it keys off this id). Falls back to the HLSS id for a
                     # not-yet-submitted frame, which makes LLSS pull it.
                     frame_id=frame.llss_frame_id or frame.id,
-                    frame_hash=frame.image_hash,
+                    frame_hash=frame.image_hash.hex(),
                     screen_type=frame.screen_type.value if frame.screen_type else None,
                     width=frame.width,
                     height=frame.height,
@@ -463,11 +527,19 @@ def get_frame_metadata(
             # Don't fail the endpoint on sync/render errors; fall back to existing frame
             pass
 
+    # No frame yet: render it in the background (it is pushed to LLSS when
+    # done) rather than rasterizing inside this poll.
     if not instance.last_frame_id:
-        frame = _render_frame(instance, db)
-    else:
-        frame = db.get(Frame, instance.last_frame_id)
-    if not frame:
+        background_tasks.add_task(_schedule_render, instance_id=instance.id)
+        return FrameMetadataResponse(
+            instance_id=instance_id,
+            has_frame=False,
+        )
+
+    meta = db.execute(
+        _FRAME_METADATA_BY_ID, {"frame_id": instance.last_frame_id}
+    ).one_or_none()
+    if not meta:
         return FrameMetadataResponse(
             instance_id=instance_id,
             has_frame=False,
@@ -478,12 +550,12 @@ def get_frame_metadata(
         has_frame=True,
         # Report the LLSS-namespace id so LLSS recognizes its cached frame and
         # returns NOOP instead of re-pulling every poll (see _check_hlss_for_new_frame).
-        frame_id=frame.llss_frame_id or frame.id,
-        frame_hash=frame.image_hash,
-        screen_type=frame.screen_type.value if frame.screen_type else None,
-        width=frame.width,
-        height=frame.height,
-        created_at=frame.created_at,
+        frame_id=meta.llss_frame_id or meta.id,
+        frame_hash=meta.image_hash.hex(),
+        screen_type=meta.screen_type.value if meta.screen_type else None,
+        width=meta.width,
+        height=meta.height,
+        created_at=meta.created_at,
     )
 
 
@@ -492,10 +564,10 @@ def get_frame_metadata(
     response_model=FrameSendResponse,
     tags=["hlss-api", "frames"],
 )
-def send_frame(
+async def send_frame(
     instance_id: str,
     background_tasks: BackgroundTasks,
-    db: DbSession,
+    db: AsyncDbSession,
     _: dict = Depends(require_llss_auth),
 ) -> FrameSendResponse:
     """
@@ -506,34 +578,26 @@ def send_frame(
 
     The instance_id is the LLSS-assigned instance ID.
     """
-    # Find instance by LLSS instance ID
-    stmt = select(Instance).where(Instance.llss_instance_id == instance_id)
-    instance = db.scalars(stmt).first()
+    instance = await _get_instance_keys_or_404(db, instance_id)
 
-    if not instance:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Instance not found: {instance_id}",
-        )
-
-    # Check if we have a frame to send
+    # Check if we have a frame to send (existence only; the blobs stay put)
     if instance.last_frame_id:
-        frame = db.get(Frame, instance.last_frame_id)
-        if frame:
+        frame_id = await db.scalar(select(Frame.id).where(Frame.id == instance.last_frame_id))
+        if frame_id:
             # Re-submit existing frame
             background_tasks.add_task(
                 _submit_existing_frame,
                 instance_id=instance.id,
-                frame_id=frame.id,
+                frame_id=frame_id,
             )
             return FrameSendResponse(
                 status="sent",
-                frame_id=frame.id,
+                frame_id=frame_id,
             )
 
     # No frame exists, render a new one
     background_tasks.add_task(
-        _render_and_submit_frame,
+        _schedule_render,
         instance_id=instance.id,
     )
     return FrameSendResponse(
@@ -547,9 +611,9 @@ def send_frame(
     status_code=status.HTTP_204_NO_CONTENT,
     tags=["hlss-api"],
 )
-def delete_instance_by_llss_id(
+async def delete_instance_by_llss_id(
     instance_id: str,
-    db: DbSession,
+    db: AsyncDbSession,
     _: dict = Depends(require_llss_auth),
 ) -> None:
     """
@@ -560,25 +624,25 @@ def delete_instance_by_llss_id(
 
     The instance_id is the LLSS-assigned instance ID.
     """
-    # Find instance by LLSS instance ID
-    stmt = select(Instance).where(Instance.llss_instance_id == instance_id)
-    instance = db.scalars(stmt).first()
-
-    if not instance:
+    # The DELETE doubles as the existence check and hands back the frame to drop.
+    result = await db.execute(
+        delete(Instance)
+        .where(Instance.llss_instance_id == instance_id)
+        .returning(Instance.last_frame_id)
+    )
+    row = result.one_or_none()
+    if row is None:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Instance not found: {instance_id}",
         )
 
-    # Delete associated frames
-    frames_stmt = select(Frame).where(Frame.id == instance.last_frame_id)
-    frames = db.scalars(frames_stmt).all()
-    for frame in frames:
-        db.delete(frame)
+    # Delete associated frames; one DELETE, no load of the frame row.
+    if row.last_frame_id:
+        await db.execute(delete(Frame).where(Frame.id == row.last_frame_id))
 
-    # Delete the instance
-    db.delete(instance)
-    db.commit()
+    await db.commit()
 
 
 # ============================================================================
@@ -632,6 +696,209 @@ def _footer_enabled_mask(button_labels: list[str]) -> int:
     return mask
 
 
+# The renderer loads fonts, piece SVGs and board geometry when constructed and
+# holds no per-frame state, so one instance serves every render.
+@cache
+def _renderer() -> RendererService:
+    return RendererService()
+
+
+@cache
+def _llss() -> LLSSService:
+    return LLSSService()
+
+
+# Setup and new-match screens are pure functions of their arguments, so
+# re-rendering an unchanged screen (force_render, frame re-sends, presses that
+# change nothing visible) is served from memory instead of rasterizing again.
+@lru_cache(maxsize=128)
+def _render_setup_screen(config_url: str) -> bytes:
+    return _renderer().render_setup_screen(config_url=config_url)
+
+
+@lru_cache(maxsize=128)
+def _render_new_match_screen(
+    mode: str,
+    card_title: str,
+    card_main: str,
+    card_sub: str,
+    primary_action: str,
+    secondary_action: str,
+    helper_text: str,
+    button_labels: tuple[str, ...],
+) -> tuple[bytes, Optional[bytes]]:
+    """Render the new-match screen and its bottom pressed strip."""
+    renderer = _renderer()
+    image_data = renderer.render_new_match_screen(
+        mode=mode,
+        card_title=card_title,
+        card_main=card_main,
+        card_sub=card_sub,
+        primary_action=primary_action,
+        secondary_action=secondary_action,
+        helper_text=helper_text,
+        button_labels=list(button_labels),
+    )
+    return image_data, renderer.render_new_match_pressed_strip(list(button_labels))
+
+
+# A screen render yields the frame PNG, the optional bottom pressed strip and
+# the bottom enabled-slot mask (0-255, bit S = slot S pressable). The strip is
+# populated only for screens with usable buttons (PIL path only); the top
+# strip stays None because HLSS draws the top as an instruction bar, not
+# per-slot buttons, and the device's invert fallback handles top presses.
+_ScreenRender = tuple[bytes, Optional[bytes], Optional[int]]
+
+
+def _render_setup(instance: Instance, db: Session) -> _ScreenRender:
+    return _render_setup_screen(instance.configuration_url or ""), None, None
+
+
+def _render_new_match(instance: Instance, db: Session) -> _ScreenRender:
+    # Get linked account for new match screen
+    username = "Not configured"
+    if instance.linked_account_id:
+        account = db.get(LichessAccount, instance.linked_account_id)
+        if account:
+            username = account.username
+
+    challenge = None
+    if instance.linked_account_id:
+        challenge = db.execute(
+            select(LichessChallenge)
+            .where(LichessChallenge.account_id == instance.linked_account_id)
+            .order_by(LichessChallenge.created_at)
+            .limit(1)
+        ).scalar_one_or_none()
+
+    new_match = load_new_match_state(instance)
+    selected_color = new_match["color"]
+    # Default selection is the first option (Stockfish nível 1) until cycled.
+    selected_adversary = ai_adversary_label(1)
+    adversary_id = new_match["adversary_id"]
+    if isinstance(adversary_id, str) and adversary_id:
+        ai_level = ai_level_from_id(adversary_id)
+        if ai_level is not None:
+            selected_adversary = ai_adversary_label(ai_level)
+        elif adversary_id.startswith("local-"):
+            acc = db.get(LichessAccount, adversary_id[len("local-"):])
+            if acc:
+                selected_adversary = acc.username
+        else:
+            adversary = db.get(Adversary, adversary_id)
+            if adversary:
+                selected_adversary = adversary.friendly_name or adversary.lichess_username
+
+    color_labels = {"white": "Brancas", "black": "Pretas", "random": "Sorteio"}
+    selected_color_label = color_labels.get(selected_color, selected_color)
+
+    if challenge:
+        challenger_name = challenge.challenger_username or "Desconhecido"
+        if challenge.challenger_title:
+            challenger_name = f"{challenge.challenger_title} {challenger_name}"
+
+        tc_label = ""
+        if challenge.time_control_type == "clock":
+            if challenge.time_control_limit is not None:
+                minutes = max(1, challenge.time_control_limit // 60)
+                inc = challenge.time_control_increment or 0
+                tc_label = f"{minutes}+{inc}"
+        elif challenge.time_control_type == "correspondence":
+            if challenge.time_control_days:
+                tc_label = f"{challenge.time_control_days}d"
+
+        details = []
+        if challenge.variant:
+            details.append(challenge.variant)
+        if challenge.speed:
+            details.append(challenge.speed)
+        if tc_label:
+            details.append(tc_label)
+        details.append("Ranqueado" if challenge.rated else "Amistoso")
+
+        card_sub = " • ".join(details)
+
+        challenge_buttons = [" "] * 8 + ["ENTER", "ESC"]
+        image_data, bottom_pressed_data = _render_new_match_screen(
+            mode="incoming",
+            card_title="Desafio recebido",
+            card_main=challenger_name,
+            card_sub=card_sub,
+            primary_action="Aceitar",
+            secondary_action="Recusar",
+            helper_text="ENTER aceita • ESC recusa",
+            button_labels=tuple(challenge_buttons),
+        )
+        return image_data, bottom_pressed_data, _footer_enabled_mask(challenge_buttons)
+
+    new_match_buttons = [
+        "< Adv",
+        " ",
+        "< Cor",
+        " ",
+        "Criar",
+        "Cor >",
+        " ",
+        "Adv >",
+        "ENTER",
+        "ESC",
+    ]
+    image_data, bottom_pressed_data = _render_new_match_screen(
+        mode="empty",
+        card_title="Novo jogo",
+        card_main=selected_adversary,
+        card_sub=f"Cor: {selected_color_label}  •  {username}",
+        primary_action="",
+        secondary_action="",
+        helper_text="< > escolhem adversário e cor  •  Criar = botão 5 / ENTER",
+        button_labels=tuple(new_match_buttons),
+    )
+    return image_data, bottom_pressed_data, _footer_enabled_mask(new_match_buttons)
+
+
+def _render_play(instance: Instance, db: Session) -> _ScreenRender:
+    # The game and the player's username in one round trip; the renderer's
+    # own db.get(Game, ...) calls then resolve from the identity map. Without
+    # a game there is nothing to play, so the setup screen is shown.
+    row = None
+    if instance.current_game_id:
+        row = db.execute(
+            select(Game, LichessAccount.username)
+            .outerjoin(LichessAccount, LichessAccount.id == instance.linked_account_id)
+            .where(Game.id == instance.current_game_id)
+        ).one_or_none()
+    if row is None:
+        return _render_setup(instance, db)
+
+    play_player_name = row.username or "Player"
+    view_mode = view_state.get(instance.id)
+    renderer = _renderer()
+    image_data = renderer.render_play_screen(
+        game_id=instance.current_game_id,
+        player_name=play_player_name,
+        db=db,
+        view_mode=view_mode,
+    )
+    bottom_pressed_data = renderer.render_play_screen_pressed_strip_pil(
+        game_id=instance.current_game_id,
+        player_name=play_player_name,
+        db=db,
+    )
+    bottom_enabled_mask = renderer.render_play_screen_enabled_mask_pil(
+        game_id=instance.current_game_id,
+        player_name=play_player_name,
+        db=db,
+    )
+    return image_data, bottom_pressed_data, bottom_enabled_mask
+
+
+_SCREEN_RENDERERS: Final[dict[ScreenType, Callable[[Instance, Session], _ScreenRender]]] = {
+    ScreenType.SETUP: _render_setup,
+    ScreenType.NEW_MATCH: _render_new_match,
+    ScreenType.PLAY: _render_play,
+}
+
+
 def _render_frame(instance: Instance, db: Session) -> Frame:
     """
     Render a frame for the given instance based on its current screen state.
@@ -646,183 +913,37 @@ def _render_frame(instance: Instance, db: Session) -> Frame:
     Returns:
         The rendered Frame object.
     """
-    renderer = RendererService()
-
-    # Optional bottom pressed strip — populated only for screens that have
-    # usable buttons (PIL path only). Top pressed strip stays None because
-    # HLSS currently draws the top as an instruction bar, not per-slot
-    # buttons; the device's invert fallback handles top presses.
-    bottom_pressed_data: Optional[bytes] = None
-    bottom_enabled_mask: Optional[int] = None  # 0-255, bit S = slot S pressable
-
-    # Render based on current screen
-    if instance.current_screen == ScreenType.SETUP:
-        image_data = renderer.render_setup_screen(config_url=instance.configuration_url or "")
-    elif instance.current_screen == ScreenType.NEW_MATCH:
-        # Get linked account for new match screen
-        username = "Not configured"
-        if instance.linked_account_id:
-            account = db.get(LichessAccount, instance.linked_account_id)
-            if account:
-                username = account.username
-
-        challenge = None
-        if instance.linked_account_id:
-            challenge = (
-                db.query(LichessChallenge)
-                .filter(LichessChallenge.account_id == instance.linked_account_id)
-                .order_by(LichessChallenge.created_at)
-                .first()
-            )
-
-        from hlss.services.new_match_state import (
-            ai_adversary_label,
-            ai_level_from_id,
-        )
-
-        selected_color = "random"
-        # Default selection is the first option (Stockfish nível 1) until cycled.
-        selected_adversary = ai_adversary_label(1)
-        if instance.new_match_state:
-            try:
-                data = json.loads(instance.new_match_state)
-                if isinstance(data, dict):
-                    new_match = data.get("new_match")
-                    if isinstance(new_match, dict):
-                        color = new_match.get("color")
-                        if color in ["random", "white", "black"]:
-                            selected_color = color
-                        if adversary_id := new_match.get("adversary_id"):
-                            ai_level = ai_level_from_id(adversary_id)
-                            if ai_level is not None:
-                                selected_adversary = ai_adversary_label(ai_level)
-                            elif adversary_id.startswith("local-"):
-                                acc = db.get(
-                                    LichessAccount, adversary_id[len("local-"):]
-                                )
-                                if acc:
-                                    selected_adversary = acc.username
-                            else:
-                                from hlss.models import Adversary
-
-                                adversary = db.get(Adversary, adversary_id)
-                                if adversary:
-                                    selected_adversary = (
-                                        adversary.friendly_name
-                                        or adversary.lichess_username
-                                    )
-            except (json.JSONDecodeError, ValueError, TypeError):
-                pass
-
-        color_labels = {"white": "Brancas", "black": "Pretas", "random": "Sorteio"}
-        selected_color_label = color_labels.get(selected_color, selected_color)
-
-        if challenge:
-            challenger_name = challenge.challenger_username or "Desconhecido"
-            if challenge.challenger_title:
-                challenger_name = f"{challenge.challenger_title} {challenger_name}"
-
-            tc_label = ""
-            if challenge.time_control_type == "clock":
-                if challenge.time_control_limit is not None:
-                    minutes = max(1, challenge.time_control_limit // 60)
-                    inc = challenge.time_control_increment or 0
-                    tc_label = f"{minutes}+{inc}"
-            elif challenge.time_control_type == "correspondence":
-                if challenge.time_control_days:
-                    tc_label = f"{challenge.time_control_days}d"
-
-            details = []
-            if challenge.variant:
-                details.append(challenge.variant)
-            if challenge.speed:
-                details.append(challenge.speed)
-            if tc_label:
-                details.append(tc_label)
-            details.append("Ranqueado" if challenge.rated else "Amistoso")
-
-            card_sub = " • ".join(details)
-
-            challenge_buttons = [" "] * 8 + ["ENTER", "ESC"]
-            bottom_enabled_mask = _footer_enabled_mask(challenge_buttons)
-            image_data = renderer.render_new_match_screen(
-                mode="incoming",
-                card_title="Desafio recebido",
-                card_main=challenger_name,
-                card_sub=card_sub,
-                primary_action="Aceitar",
-                secondary_action="Recusar",
-                helper_text="ENTER aceita • ESC recusa",
-                button_labels=challenge_buttons,
-            )
-            bottom_pressed_data = renderer.render_new_match_pressed_strip(challenge_buttons)
-        else:
-            new_match_buttons = [
-                "< Adv",
-                " ",
-                "< Cor",
-                " ",
-                "Criar",
-                "Cor >",
-                " ",
-                "Adv >",
-                "ENTER",
-                "ESC",
-            ]
-            bottom_enabled_mask = _footer_enabled_mask(new_match_buttons)
-            image_data = renderer.render_new_match_screen(
-                mode="empty",
-                card_title="Novo jogo",
-                card_main=selected_adversary,
-                card_sub=f"Cor: {selected_color_label}  •  {username}",
-                primary_action="",
-                secondary_action="",
-                helper_text="< > escolhem adversário e cor  •  Criar = botão 5 / ENTER",
-                button_labels=new_match_buttons,
-            )
-            bottom_pressed_data = renderer.render_new_match_pressed_strip(new_match_buttons)
-    elif instance.current_screen == ScreenType.PLAY:
-        # Render play screen - requires game state
-        if instance.current_game_id:
-            play_player_name = (
-                instance.linked_account.username if instance.linked_account else "Player"
-            )
-            from hlss.services import view_state
-            view_mode = view_state.get(instance.id)
-            image_data = renderer.render_play_screen(
-                game_id=instance.current_game_id,
-                player_name=play_player_name,
-                db=db,
-                view_mode=view_mode,
-            )
-            bottom_pressed_data = renderer.render_play_screen_pressed_strip_pil(
-                game_id=instance.current_game_id,
-                player_name=play_player_name,
-                db=db,
-            )
-            bottom_enabled_mask = renderer.render_play_screen_enabled_mask_pil(
-                game_id=instance.current_game_id,
-                player_name=play_player_name,
-                db=db,
-            )
-        else:
-            image_data = renderer.render_setup_screen(config_url=instance.configuration_url or "")
-    else:
-        # Default to setup screen
-        image_data = renderer.render_setup_screen(config_url=instance.configuration_url or "")
+    # Screens without a renderer of their own fall back to the setup screen.
+    render = _SCREEN_RENDERERS.get(instance.current_screen, _render_setup)
+    image_data, bottom_pressed_data, bottom_enabled_mask = render(instance, db)
 
     # Compute hash
-    image_hash = hashlib.sha256(image_data).hexdigest()
+    image_hash = hashlib.sha256(image_data).digest()
 
     # Consume any pending "needs full refresh" hint set by the input
     # processor (view toggle, move applied) or the game-stream worker
     # (opponent move arrived). The flag rides on the Frame so a
     # downstream re-submit can forward it to LLSS in the same multipart.
-    from hlss.services import refresh_state
     full_refresh = refresh_state.consume(instance.id)
 
-    # Store frame locally
+    # Nothing on screen changed since the last frame: hand that frame back
+    # instead of storing an identical copy.
+    if instance.last_frame_id:
+        last_frame = db.get(Frame, instance.last_frame_id)
+        if (
+            last_frame is not None
+            and last_frame.image_hash == image_hash
+            and last_frame.screen_type == instance.current_screen
+            and last_frame.bottom_pressed_data == bottom_pressed_data
+            and last_frame.bottom_enabled_mask == bottom_enabled_mask
+            and bool(last_frame.full_refresh) == full_refresh
+        ):
+            return last_frame
+
+    # Store frame locally. The id is assigned here rather than by a flush, so
+    # the insert and the last_frame_id update go out together at commit.
     frame = Frame(
+        id=generate_uuid(),
         screen_type=instance.current_screen,
         image_data=image_data,
         image_hash=image_hash,
@@ -833,51 +954,42 @@ def _render_frame(instance: Instance, db: Session) -> Frame:
         full_refresh=full_refresh,
     )
     db.add(frame)
-    db.flush()  # Flush to get the frame ID
     instance.last_frame_id = frame.id
     db.commit()
-    db.refresh(frame)
 
     return frame
 
 
-def _deserialize_move_state(serialized: Optional[str]) -> MoveState:
-    """Restore a MoveState from the stored JSON blob."""
+def _deserialize_move_state(serialized: Optional[dict]) -> MoveState:
+    """Restore a MoveState from the stored JSON document."""
 
-    if not serialized:
+    if not isinstance(serialized, dict):
         return MoveState()
 
     try:
-        data = json.loads(serialized)
-        if isinstance(data, dict):
-            return MoveState(**data)
-    except (json.JSONDecodeError, ValueError, TypeError):
-        pass
-
-    return MoveState()
+        return MoveState(**serialized)
+    except (ValueError, TypeError):
+        return MoveState()
 
 
-async def _submit_frame(instance: Instance, frame: Frame, db: Session) -> Optional[str]:
+async def _submit_frame(llss_instance_id: str, frame: Frame) -> Optional[str]:
     """
     Submit a frame to LLSS.
 
+    Only the upload runs on the event loop; recording the LLSS frame id goes
+    through a worker thread with its own session.
+
     Args:
-        instance: The instance the frame belongs to.
-        frame: The frame to submit.
-        db: Database session.
+        llss_instance_id: The LLSS id of the instance the frame belongs to.
+        frame: The frame to submit (may be detached).
 
     Returns:
         The frame ID if successful, None otherwise.
     """
-    from hlss.services.llss import LLSSService
-
-    if not instance.llss_instance_id:
-        return None
-
-    llss = LLSSService()
+    llss = _llss()
     try:
         result = await llss.submit_frame(
-            instance_id=instance.llss_instance_id,
+            instance_id=llss_instance_id,
             image_data=frame.image_data,
             top_pressed=frame.top_pressed_data,
             bottom_pressed=frame.bottom_pressed_data,
@@ -887,64 +999,154 @@ async def _submit_frame(instance: Instance, frame: Frame, db: Session) -> Option
         )
 
         # Update frame with LLSS response
-        frame.llss_frame_id = result.get("frame_id")
-        frame.submitted_at = datetime.utcnow()
-        db.commit()
+        llss_frame_id = result.get("frame_id")
+        await asyncio.to_thread(_record_frame_submission, frame.id, llss_frame_id)
 
-        return frame.llss_frame_id
+        return llss_frame_id
     except Exception as e:
         # Log error but don't fail
         print(f"Failed to submit frame to LLSS: {e}")
         return None
 
 
-async def _render_and_submit_frame(instance_id: str) -> Optional[str]:
-    """
-    Render current screen and submit to LLSS.
+def _record_frame_submission(frame_id: str, llss_frame_id: Optional[str]) -> None:
+    """Store the id LLSS assigned to a submitted frame."""
+    with SessionLocal() as db:
+        db.execute(
+            update(Frame)
+            .where(Frame.id == frame_id)
+            .values(llss_frame_id=llss_frame_id, submitted_at=func.now())
+        )
+        db.commit()
 
-    This is called as a background task after input processing or render request.
 
-    Returns the frame ID if successful, None otherwise.
+def _load_and_render_frame(instance_id: str) -> Optional[tuple[str, Frame]]:
     """
-    from hlss.database import SessionLocal
+    Load an instance and render its frame in one worker-thread session.
 
-    db = SessionLocal()
-    try:
+    Returns the instance's LLSS id and the frame, detached with its columns
+    still loaded, or None if the instance is missing or not linked to LLSS.
+    """
+    with SessionLocal(expire_on_commit=False) as db:
         instance = db.get(Instance, instance_id)
         if not instance or not instance.llss_instance_id:
             return None
+        return instance.llss_instance_id, _render_frame(instance, db)
 
-        frame = _render_frame(instance, db)
-        return await _submit_frame(instance, frame, db)
 
-    finally:
-        db.close()
+def _load_existing_frame(instance_id: str, frame_id: str) -> Optional[tuple[str, Frame]]:
+    """Load an instance's LLSS id and a stored frame in a worker-thread session."""
+    with SessionLocal() as db:
+        instance = db.get(Instance, instance_id)
+        if not instance or not instance.llss_instance_id:
+            return None
+        frame = db.get(Frame, frame_id)
+        if not frame:
+            return None
+        return instance.llss_instance_id, frame
+
+
+# Background renders go through a queue drained by a fixed pool of workers
+# started with the app. An instance is queued at most once and never while it
+# is rendering: a request for a queued instance is absorbed by the pending
+# render (which reads the latest state when it runs), and a request arriving
+# mid-render is queued again once that render finishes. Renders of one
+# instance therefore run one after another, so an older render can never be
+# stored or uploaded after a newer one. Maps instance id -> resubmit flag.
+_render_queue: Optional[asyncio.Queue[str]] = None
+_queued_renders: dict[str, bool] = {}
+_rendering: set[str] = set()
+_render_workers: list[asyncio.Task] = []
+
+
+async def start_render_workers() -> None:
+    """Create the render queue and its workers on the running loop."""
+    global _render_queue
+    _render_queue = asyncio.Queue()
+    _render_workers.extend(
+        asyncio.create_task(_render_worker(_render_queue))
+        for _ in range(settings.render_workers)
+    )
 
 
-async def _submit_existing_frame(instance_id: str, frame_id: str) -> Optional[str]:
+async def stop_render_workers() -> None:
+    """Cancel the render workers, dropping any renders still queued."""
+    global _render_queue
+    for worker in _render_workers:
+        worker.cancel()
+    await asyncio.gather(*_render_workers, return_exceptions=True)
+    _render_workers.clear()
+    _queued_renders.clear()
+    _rendering.clear()
+    _render_queue = None
+
+
+async def _render_worker(queue: asyncio.Queue[str]) -> None:
+    while True:
+        instance_id = await queue.get()
+        resubmit = _queued_renders.pop(instance_id, False)
+        _rendering.add(instance_id)
+        try:
+            await _render_and_submit_frame(instance_id, resubmit=resubmit)
+        except Exception:
+            logger.exception("Background render failed for instance %s", instance_id)
+        finally:
+            _rendering.discard(instance_id)
+            # Requested while this render ran: render the newer state next.
+            if instance_id in _queued_renders:
+                queue.put_nowait(instance_id)
+            queue.task_done()
+
+
+async def _schedule_render(instance_id: str, resubmit: bool = False) -> None:
+    """Queue a background render unless one is already pending for the instance."""
+    if _render_queue is None:
+        await _render_and_submit_frame(instance_id, resubmit=resubmit)
+        return
+    if instance_id in _queued_renders:
+        _queued_renders[instance_id] |= resubmit
+        return
+    _queued_renders[instance_id] = resubmit
+    # A render in progress re-queues the instance itself when it finishes.
+    if instance_id not in _rendering:
+        _render_queue.put_nowait(instance_id)
+
+
+async def _render_and_submit_frame(instance_id: str, resubmit: bool = False) -> Optional[str]:
     """
-    Submit an existing frame to LLSS.
+    Render current screen and submit to LLSS.
 
-    This is called as a background task when LLSS requests a frame re-send.
+    This is called as a background task after input processing or render request.
+    If the render reproduces the last frame and LLSS already has it, the upload
+    is skipped unless ``resubmit`` is set (LLSS asked because it lost state).
 
     Returns the frame ID if successful, None otherwise.
     """
-    from hlss.database import SessionLocal
+    # Loading, rendering (CPU-bound) and storing the frame all happen in one
+    # worker thread that owns its session, so the event loop only awaits the
+    # upload to LLSS and queued submissions keep flowing while a frame renders.
+    rendered = await asyncio.to_thread(_load_and_render_frame, instance_id)
+    if rendered is None:
+        return None
+    llss_instance_id, frame = rendered
+    if frame.llss_frame_id and not resubmit:
+        return frame.llss_frame_id
+    return await _submit_frame(llss_instance_id, frame)
 
-    db = SessionLocal()
-    try:
-        instance = db.get(Instance, instance_id)
-        if not instance or not instance.llss_instance_id:
-            return None
 
-        frame = db.get(Frame, frame_id)
-        if not frame:
-            return None
+async def _submit_existing_frame(instance_id: str, frame_id: str) -> Optional[str]:
+    """
+    Submit an existing frame to LLSS.
 
-        return await _submit_frame(instance, frame, db)
+    This is called as a background task when LLSS requests a frame re-send.
 
-    finally:
-        db.close()
+    Returns the frame ID if successful, None otherwise.
+    """
+    loaded = await asyncio.to_thread(_load_existing_frame, instance_id, frame_id)
+    if loaded is None:
+        return None
+    llss_instance_id, frame = loaded
+    return await _submit_frame(llss_instance_id, frame)
 
 
 # ============================================================================
@@ -953,16 +1155,53 @@ async def _submit_existing_frame(instance_id: str, frame_id: str) -> Optional[st
 
 
 @router.get("", response_model=list[InstanceResponse])
-def list_instances(db: DbSession) -> list[Instance]:
-    """List all HLSS instances."""
-    stmt = select(Instance).order_by(Instance.created_at.desc())
-    return list(db.scalars(stmt).all())
+async def list_instances(
+    request: Request,
+    response: Response,
+    db: AsyncDbSession,
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+    before: datetime | None = None,
+    before_id: UUID | None = None,
+) -> list[Instance]:
+    """
+    List HLSS instances, newest first.
+
+    Pages are keyed on (created_at, id). A full page carries a ``Link``
+    header with ``rel="next"`` whose ``before``/``before_id`` continue after
+    its last instance; instances sharing a timestamp are ordered by id, so
+    none are skipped at a page boundary.
+    """
+    stmt = select(Instance).options(raiseload("*"))
+
+    if before:
+        # created_at is a naive UTC timestamp; an aware cursor is converted.
+        if before.tzinfo is not None:
+            before = before.astimezone(timezone.utc).replace(tzinfo=None)
+        if before_id:
+            stmt = stmt.where(tuple_(Instance.created_at, Instance.id) < (before, str(before_id)))
+        else:
+            stmt = stmt.where(Instance.created_at < before)
+
+    stmt = stmt.order_by(Instance.created_at.desc(), Instance.id.desc()).limit(limit)
+    instances = list((await db.scalars(stmt)).all())
+
+    if len(instances) == limit:
+        last = instances[-1]
+        next_url = request.url.include_query_params(
+            before=last.created_at.isoformat(), before_id=last.id
+        )
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+    return instances
 
 
 @router.get("/by-id/{instance_id}", response_model=InstanceResponse)
-def get_instance(instance_id: str, db: DbSession) -> Instance:
+async def get_instance(instance_id: str, db: AsyncDbSession) -> Instance:
     """Get a specific instance by internal ID."""
-    instance = db.get(Instance, instance_id)
+    instance = (
+        await db.get(Instance, instance_id, options=[raiseload("*")])
+        if is_uuid(instance_id)
+        else None
+    )
     if not instance:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -972,7 +1211,7 @@ def get_instance(instance_id: str, db: DbSession) -> Instance:
 
 
 @router.post("", response_model=InstanceResponse, status_code=status.HTTP_201_CREATED)
-def create_instance(data: InstanceCreate, db: DbSession) -> Instance:
+async def create_instance(data: InstanceCreate, db: AsyncDbSession) -> Instance:
     """
     Create a new HLSS instance.
 
@@ -985,82 +1224,122 @@ def create_instance(data: InstanceCreate, db: DbSession) -> Instance:
         current_screen=ScreenType.SETUP,
     )
     db.add(instance)
-    db.commit()
-    db.refresh(instance)
+    # The INSERT returns the server defaults (created_at, updated_at) itself,
+    # and expire_on_commit=False keeps them loaded, so there is no refresh.
+    await db.commit()
 
     return instance
 
 
 @router.patch("/by-id/{instance_id}/screen", response_model=InstanceResponse)
-def update_instance_screen(
+async def update_instance_screen(
     instance_id: str,
     screen_type: str,
-    db: DbSession,
+    db: AsyncDbSession,
     game_id: str | None = None,
 ) -> Instance:
     """Update the current screen for an instance."""
-    instance = db.get(Instance, instance_id)
-    if not instance:
+    screen = _SCREEN_TYPES.get(screen_type)
+    if screen is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid screen type: {screen_type}",
+        )
+    if game_id is not None and not is_uuid(game_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid game id: {game_id}",
+        )
+    if not is_uuid(instance_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Instance not found",
         )
 
-    try:
-        instance.current_screen = ScreenType(screen_type)
-    except ValueError:
+    # UPDATE ... RETURNING writes and reloads the row in one round trip.
+    instance = await db.scalar(
+        update(Instance)
+        .where(Instance.id == instance_id)
+        .values(current_screen=screen, current_game_id=game_id)
+        .returning(Instance)
+    )
+    if instance is None:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid screen type: {screen_type}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Instance not found",
         )
-
-    instance.current_game_id = game_id
-    db.commit()
-    db.refresh(instance)
+    await db.commit()
 
     return instance
 
 
 @router.patch("/by-id/{instance_id}/link-account", response_model=InstanceResponse)
-def link_account_to_instance(
+async def link_account_to_instance(
     instance_id: str,
     account_id: str,
-    db: DbSession,
+    db: AsyncDbSession,
 ) -> Instance:
     """Link a Lichess account to an instance."""
-    instance = db.get(Instance, instance_id)
-    if not instance:
+    if not is_uuid(instance_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Instance not found",
         )
-
-    account = db.get(LichessAccount, account_id)
-    if not account:
+    if not is_uuid(account_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Account not found",
         )
 
-    instance.linked_account_id = account_id
-    instance.is_ready = True
-    instance.needs_configuration = False
-    instance.current_screen = ScreenType.NEW_MATCH
-    db.commit()
-    db.refresh(instance)
+    # One UPDATE ... RETURNING, guarded on the account existing, does the
+    # checks, the write and the reload; the 404 cause is looked up only on a miss.
+    instance = await db.scalar(
+        update(Instance)
+        .where(
+            Instance.id == instance_id,
+            select(LichessAccount.id).where(LichessAccount.id == account_id).exists(),
+        )
+        .values(
+            linked_account_id=account_id,
+            is_ready=True,
+            needs_configuration=False,
+            current_screen=ScreenType.NEW_MATCH,
+        )
+        .returning(Instance)
+    )
+    if instance is None:
+        await db.rollback()
+        if await db.get(Instance, instance_id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Instance not found",
+            )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Account not found",
+        )
+    await db.commit()
 
     return instance
 
 
 @router.delete("/by-id/{instance_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_instance(instance_id: str, db: DbSession) -> None:
+async def delete_instance(instance_id: str, db: AsyncDbSession) -> None:
     """Delete an HLSS instance."""
-    instance = db.get(Instance, instance_id)
-    if not instance:
+    if not is_uuid(instance_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Instance not found",
         )
 
-    db.delete(instance)
-    db.commit()
+    # The DELETE doubles as the existence check; no row is loaded.
+    result = cast(
+        CursorResult[Any], await db.execute(delete(Instance).where(Instance.id == instance_id))
+    )
+    if result.rowcount == 0:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Instance not found",
+        )
+    await db.commit()
@@ -6,7 +6,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 # ============================================================================
 # Enums
@@ -188,6 +188,12 @@ class FrameResponse(BaseModel):
     submitted_at: Optional[datetime]
     created_at: datetime
 
+    @field_validator("image_hash", mode="before")
+    @classmethod
+    def _hex_image_hash(cls, value: bytes | str) -> str:
+        """Frames store the raw digest; the API exposes it as hex."""
+        return value.hex() if isinstance(value, bytes) else value
+
 
 class FrameCreateResponse(BaseModel):
     """Schema for frame creation response from LLSS."""
@@ -310,6 +316,16 @@ class AdversaryUpdate(BaseModel):
     friendly_name: str = Field(..., min_length=1, max_length=255)
 
 
+class ConfigurationStatusResponse(BaseModel):
+    """Configuration status of an instance, polled by the setup page."""
+
+    instance_id: str
+    is_configured: bool
+    is_ready: bool
+    linked_account: Optional[str] = None
+    current_screen: Optional[str] = None
+
+
 # ============================================================================
 # Health Check Schemas
 # ============================================================================
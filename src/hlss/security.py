@@ -4,6 +4,10 @@ Security helpers for LLSS ↔ HLSS authentication.
 
 from __future__ import annotations
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -17,6 +21,14 @@ settings = get_settings()
 _bearer_scheme = HTTPBearer(auto_error=False)
 
 _ALLOWED_TOKEN_TYPES = {"llss_admin", "instance_access"}
+_ALGORITHMS = ["HS256"]
+
+# Verified tokens are remembered briefly so LLSS polls skip the HMAC check.
+# Keyed by the token's SHA-256 digest so raw credentials are not kept around.
+_VERIFIED_CACHE_SIZE = 256
+_VERIFIED_CACHE_TTL_SECONDS = 30.0
+_verified_tokens: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+_verified_tokens_lock = threading.Lock()
 
 
 def _get_shared_key() -> str:
@@ -57,6 +69,36 @@ def create_llss_token(token_type: str, subject: str | None = None) -> str:
     return jwt.encode(payload, shared_key, algorithm="HS256")
 
 
+def _verify_token(token: str) -> dict[str, Any]:
+    """
+    Decode and verify a token, reusing a recent verification of the same token.
+
+    Cache entries live until the token's ``exp`` or the cache TTL, whichever
+    comes first. Callers get their own copy of the payload.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+    with _verified_tokens_lock:
+        entry = _verified_tokens.get(key)
+        if entry is not None:
+            expires_at, payload = entry
+            if expires_at > now:
+                _verified_tokens.move_to_end(key)
+                return dict(payload)
+            del _verified_tokens[key]
+
+    payload = jwt.decode(token, _get_shared_key(), algorithms=_ALGORITHMS)
+    expires_at = now + _VERIFIED_CACHE_TTL_SECONDS
+    if "exp" in payload:
+        expires_at = min(expires_at, float(payload["exp"]))
+    with _verified_tokens_lock:
+        _verified_tokens[key] = (expires_at, payload)
+        _verified_tokens.move_to_end(key)
+        while len(_verified_tokens) > _VERIFIED_CACHE_SIZE:
+            _verified_tokens.popitem(last=False)
+    return dict(payload)
+
+
 def require_llss_auth(
     credentials: HTTPAuthorizationCredentials | None = Depends(_bearer_scheme),
 ) -> dict[str, Any]:
@@ -71,10 +113,8 @@ def require_llss_auth(
             detail="Missing or invalid authorization header",
         )
 
-    shared_key = _get_shared_key()
-
     try:
-        payload = jwt.decode(credentials.credentials, shared_key, algorithms=["HS256"])
+        payload = _verify_token(credentials.credentials)
     except jwt.ExpiredSignatureError as exc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -3,13 +3,26 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import base64
 import os
-from concurrent.futures import ThreadPoolExecutor
+import re
+import threading
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Literal, NamedTuple, Optional
+
+from hlss.config import get_settings
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext, CDPSession, Page, Playwright
 
 DEFAULT_CDP_URL = "ws://localhost:3000"
 
+WaitUntil = Literal["load", "domcontentloaded", "networkidle"]
+
 
 def render_html_to_png(
     html: str,
@@ -17,6 +30,8 @@ def render_html_to_png(
     height: int = 480,
     base_url: Optional[str] = None,
     cdp_url: Optional[str] = None,
+    wait_until: WaitUntil = "load",
+    wait_for: Optional[str] = None,
 ) -> bytes:
     """Render an HTML string to PNG bytes.
 
@@ -25,6 +40,9 @@ def render_html_to_png(
         width: Viewport width in pixels.
         height: Viewport height in pixels.
         base_url: Optional base URL for resolving relative assets.
+        wait_until: Page event to wait for before the screenshot. "load" is
+            enough for static markup; "networkidle" adds a 500 ms quiet window.
+        wait_for: Optional CSS selector that must be visible first.
 
     Returns:
         PNG image bytes.
@@ -36,19 +54,151 @@ def render_html_to_png(
             height=height,
             base_url=base_url,
             cdp_url=cdp_url,
+            wait_until=wait_until,
+            wait_for=wait_for,
         )
     )
 
 
-def _run_async(coro):
-    """Run an async coroutine from sync context safely."""
+# Playwright objects are bound to the loop that created them, so every render
+# runs on one long-lived loop in a daemon thread; sync callers block on it.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """uvloop when available (uvicorn[standard] installs it), else asyncio's."""
     try:
-        asyncio.get_running_loop()
-    except RuntimeError:
-        return asyncio.run(coro)
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
+def _renderer_loop() -> asyncio.AbstractEventLoop:
+    """Start the shared renderer loop on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = _new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="html-renderer", daemon=True).start()
+            atexit.register(_shutdown)
+    return _loop
+
+
+def _run_async(coro):
+    """Run a coroutine on the renderer loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _renderer_loop()).result()
+
+
+def _shutdown() -> None:
+    """Close the pooled browsers and stop the renderer loop at exit."""
+    if _loop is None:
+        return
+    with suppress(Exception):
+        asyncio.run_coroutine_threadsafe(_pool.close(), _loop).result(timeout=5)
+    _loop.call_soon_threadsafe(_loop.stop)
+
+
+class _PooledPage(NamedTuple):
+    page: Page
+    # Raw CDP session on the page, opened once and reused for screenshots.
+    cdp: CDPSession
+
+
+class _BrowserPool:
+    """Browser connections and warm pages kept open across renders.
 
-    with ThreadPoolExecutor(max_workers=1) as executor:
-        return executor.submit(lambda: asyncio.run(coro)).result()
+    Connecting over CDP and bringing up a context cost far more than the
+    screenshot itself. Each browser screenshots one page at a time, so
+    renders are spread round-robin over the configured endpoints and capped
+    at ``page_pool_size`` pages per endpoint. Every method runs on the
+    renderer loop.
+    """
+
+    def __init__(self, page_pool_size: int) -> None:
+        self._page_pool_size = page_pool_size
+        self._playwright: Optional[Playwright] = None
+        # One context per browser endpoint ("" is a locally launched Chromium).
+        self._contexts: dict[str, BrowserContext] = {}
+        self._slots: dict[str, asyncio.Semaphore] = {}
+        # Idle pages by (endpoint, width, height), ready for the next render.
+        self._idle: dict[tuple[str, int, int], list[_PooledPage]] = {}
+        self._next_endpoint = 0
+        self._lock = asyncio.Lock()
+
+    async def _context(self, cdp_url: str) -> BrowserContext:
+        async with self._lock:
+            context = self._contexts.get(cdp_url)
+            if context is not None and context.browser.is_connected():
+                return context
+
+            if self._playwright is None:
+                try:
+                    from playwright.async_api import async_playwright
+                except ImportError as exc:
+                    raise RuntimeError("playwright is required for HTML rendering") from exc
+                self._playwright = await async_playwright().start()
+
+            if cdp_url:
+                browser = await self._playwright.chromium.connect_over_cdp(cdp_url)
+                context = browser.contexts[0] if browser.contexts else await browser.new_context()
+            else:
+                browser = await self._playwright.chromium.launch()
+                context = await browser.new_context()
+            self._contexts[cdp_url] = context
+            # Pages of a previous connection died with it.
+            for key in [key for key in self._idle if key[0] == cdp_url]:
+                del self._idle[key]
+            return context
+
+    @asynccontextmanager
+    async def page(
+        self, endpoints: list[str], width: int, height: int
+    ) -> AsyncIterator[_PooledPage]:
+        """Lend a page sized to the display; it goes back to the pool afterwards."""
+        cdp_url = endpoints[self._next_endpoint % len(endpoints)]
+        self._next_endpoint += 1
+
+        slots = self._slots.setdefault(cdp_url, asyncio.Semaphore(self._page_pool_size))
+        async with slots:
+            key = (cdp_url, width, height)
+            idle = self._idle.setdefault(key, [])
+            pooled = None
+            while idle and pooled is None:
+                candidate = idle.pop()
+                if not candidate.page.is_closed():
+                    pooled = candidate
+            if pooled is None:
+                context = await self._context(cdp_url)
+                page = await context.new_page()
+                await page.set_viewport_size({"width": width, "height": height})
+                pooled = _PooledPage(page, await context.new_cdp_session(page))
+
+            try:
+                yield pooled
+            except BaseException:
+                # A failed render may leave the page mid-navigation; drop it.
+                with suppress(Exception):
+                    await pooled.page.close()
+                raise
+            # set_content replaces the whole document, so no reset is needed.
+            if self._idle.get(key) is idle and not pooled.page.is_closed():
+                idle.append(pooled)
+
+    async def close(self) -> None:
+        """Disconnect every browser and stop the Playwright driver."""
+        self._idle.clear()
+        for context in self._contexts.values():
+            with suppress(Exception):
+                await context.browser.close()
+        self._contexts.clear()
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+_pool = _BrowserPool(get_settings().chrome_page_pool_size)
 
 
 async def _render_html_to_png_async(
@@ -57,28 +207,36 @@ async def _render_html_to_png_async(
     height: int = 480,
     base_url: Optional[str] = None,
     cdp_url: Optional[str] = None,
+    wait_until: WaitUntil = "load",
+    wait_for: Optional[str] = None,
 ) -> bytes:
     """Async HTML rendering via Playwright."""
-    try:
-        from playwright.async_api import async_playwright
-    except ImportError as exc:
-        raise RuntimeError("playwright is required for HTML rendering") from exc
-
-    async with async_playwright() as playwright:
-        resolved_cdp = cdp_url or os.getenv("PLAYWRIGHT_CDP_URL") or DEFAULT_CDP_URL
-        if resolved_cdp:
-            browser = await playwright.chromium.connect_over_cdp(resolved_cdp)
-            context = browser.contexts[0] if browser.contexts else await browser.new_context()
-            page = await context.new_page()
-            await page.set_viewport_size({"width": width, "height": height})
-        else:
-            browser = await playwright.chromium.launch()
-            page = await browser.new_page(viewport={"width": width, "height": height})
-
-        await page.set_content(html, wait_until="networkidle")
-        png_bytes = await page.screenshot(type="png", full_page=False)
-        await browser.close()
-        return png_bytes
+    # PLAYWRIGHT_CDP_URL may list several browsers, comma-separated.
+    resolved_cdp = cdp_url or os.getenv("PLAYWRIGHT_CDP_URL") or DEFAULT_CDP_URL
+    endpoints = [url.strip() for url in resolved_cdp.split(",")]
+    async with _pool.page(endpoints, width, height) as (page, cdp):
+        await page.set_content(html, wait_until=wait_until)
+        if wait_for:
+            await page.wait_for_selector(wait_for, state="visible")
+        # One CDP call; page.screenshot() adds caret/animation/font handling
+        # round trips that a static page with installed fonts doesn't need.
+        result = await cdp.send(
+            "Page.captureScreenshot", {"format": "png", "captureBeyondViewport": False}
+        )
+        return base64.b64decode(result["data"])
+
+
+@lru_cache(maxsize=32)
+def _load_template(path: Path, mtime_ns: int) -> str:
+    """Template text; the mtime in the key picks up edits to the file."""
+    return path.read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=32)
+def _placeholder_pattern(keys: tuple[str, ...]) -> re.Pattern[str]:
+    """One alternation over every placeholder, so a render scans the template once."""
+    # Longest first, so no placeholder can shadow a longer one it prefixes.
+    return re.compile("|".join(map(re.escape, sorted(keys, key=len, reverse=True))))
 
 
 def render_html_file_to_png(
@@ -87,6 +245,8 @@ def render_html_file_to_png(
     height: int = 480,
     cdp_url: Optional[str] = None,
     replacements: Optional[dict[str, str]] = None,
+    wait_until: WaitUntil = "load",
+    wait_for: Optional[str] = None,
 ) -> bytes:
     """Render an HTML file to PNG bytes.
 
@@ -94,15 +254,17 @@ def render_html_file_to_png(
         html_path: Path to the HTML file.
         width: Viewport width in pixels.
         height: Viewport height in pixels.
+        wait_until: Page event to wait for (see render_html_to_png).
+        wait_for: Optional CSS selector that must be visible first.
 
     Returns:
         PNG image bytes.
     """
     path = Path(html_path)
-    html = path.read_text(encoding="utf-8")
+    html = _load_template(path, path.stat().st_mtime_ns)
     if replacements:
-        for key, value in replacements.items():
-            html = html.replace(key, value)
+        pattern = _placeholder_pattern(tuple(replacements))
+        html = pattern.sub(lambda match: replacements[match.group(0)], html)
     base_url = path.parent.as_uri()
     return render_html_to_png(
         html,
@@ -110,4 +272,6 @@ def render_html_file_to_png(
         height=height,
         base_url=base_url,
         cdp_url=cdp_url,
+        wait_until=wait_until,
+        wait_for=wait_for,
     )
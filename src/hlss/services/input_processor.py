@@ -2,12 +2,12 @@
 Input processor service for handling device button events.
 """
 
-import json
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Optional
 
 import chess
+import orjson
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
@@ -90,6 +90,9 @@ class InputProcessorService:
         ButtonType.BTN_8: 8,
     }
 
+    # Buttons that offer a list of options, in display order
+    OPTION_BUTTONS = tuple(RANK_BUTTONS)
+
     def __init__(self, db: Session):
         self.db = db
 
@@ -624,7 +627,7 @@ class InputProcessorService:
                 existing_game.moves = new_moves
                 # Save full raw JSON for inspection
                 try:
-                    existing_game.raw_json = json.dumps(game_data)
+                    existing_game.raw_json = orjson.dumps(game_data).decode()
                 except Exception:
                     existing_game.raw_json = None
             else:
@@ -643,7 +646,9 @@ class InputProcessorService:
                     ),
                     last_move=last_move,
                     moves=moves,
-                    raw_json=(json.dumps(game_data) if isinstance(game_data, dict) else None),
+                    raw_json=(
+                        orjson.dumps(game_data).decode() if isinstance(game_data, dict) else None
+                    ),
                 )
                 self.db.add(new_game)
 
@@ -678,12 +683,8 @@ class InputProcessorService:
                         db_game.last_move = gamestate.get("lastMove", db_game.last_move)
                         db_game.is_my_turn = bool(gamestate.get("isMyTurn", False))
                         db_game.status = self._map_game_status(gamestate.get("status"))
-                        db_game.raw_json = json.dumps(
-                            state,
-                            default=lambda obj: (
-                                obj.isoformat() if hasattr(obj, "isoformat") else str(obj)
-                            ),
-                        )
+                        # orjson writes datetimes as ISO 8601 itself.
+                        db_game.raw_json = orjson.dumps(state, default=str).decode()
                 except Exception:
                     # If stream fails, just mark as finished with unknown status
                     db_game.status = GameStatus.UNKNOWN_FINISH
@@ -739,8 +740,8 @@ class InputProcessorService:
             existing.time_control_limit = time_control.get("limit")
             existing.time_control_increment = time_control.get("increment")
             existing.time_control_days = time_control.get("days")
-            existing.raw_json = json.dumps(challenge)
-            existing.updated_at = datetime.utcnow()
+            existing.raw_json = orjson.dumps(challenge).decode()
+            existing.updated_at = func.now()
 
         # Remove challenges no longer present
         if incoming_ids:
@@ -1144,18 +1145,16 @@ class InputProcessorService:
 
     def _load_move_state(self, game: Game) -> MoveState:
         """Load move state from the game or create a new one."""
-        if game.move_state:
+        if isinstance(game.move_state, dict):
             try:
-                data = json.loads(game.move_state)
-                if isinstance(data, dict):
-                    return MoveState(**data)
-            except (json.JSONDecodeError, ValueError):
+                return MoveState(**game.move_state)
+            except ValueError:
                 pass
         return MoveState()
 
     def _save_move_state(self, game: Game, move_state: MoveState) -> None:
         """Save move state to the game."""
-        game.move_state = json.dumps(move_state.model_dump())
+        game.move_state = move_state.model_dump(mode="json")
         self.db.commit()
 
     def _clear_move_state(self, game: Game) -> None:
@@ -1556,8 +1555,7 @@ class InputProcessorService:
         """
         buttons: dict[ButtonType, tuple[str, bool]] = {}
 
-        for i, option_uci in enumerate(move_state.disambiguation_options):
-            btn = ButtonType(f"BTN_{i + 1}")
+        for btn, option_uci in zip(self.OPTION_BUTTONS, move_state.disambiguation_options):
             try:
                 mv = chess.Move.from_uci(option_uci)
                 label = board.san(mv)
@@ -2,7 +2,10 @@
 LLSS (Low Level Screen Service) integration service.
 """
 
+import asyncio
 import hashlib
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any, Optional
 from urllib.parse import urlsplit, urlunsplit
 
@@ -26,6 +29,46 @@ def _normalize_llss_base_url(base_url: str) -> str:
     return urlunsplit((parts.scheme, parts.netloc, path, parts.query, parts.fragment))
 
 
+# Keep-alive client shared by every LLSS call made on the application's event
+# loop, so frame submissions reuse pooled connections instead of paying a new
+# TCP/TLS handshake each. Opened and closed by the app lifespan.
+_shared_client: Optional[httpx.AsyncClient] = None
+_shared_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def open_shared_client() -> None:
+    """Create the shared LLSS client on the running (application) loop."""
+    global _shared_client, _shared_loop
+    _shared_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    )
+    _shared_loop = asyncio.get_running_loop()
+
+
+async def close_shared_client() -> None:
+    """Close the shared LLSS client."""
+    global _shared_client, _shared_loop
+    if _shared_client is not None:
+        await _shared_client.aclose()
+    _shared_client = None
+    _shared_loop = None
+
+
+@asynccontextmanager
+async def _client() -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the shared client, or a short-lived one off the application loop.
+
+    Sync handlers that drive a submission through asyncio.run() are on their
+    own temporary loop, which the shared client's connections cannot be used
+    from.
+    """
+    if _shared_client is not None and asyncio.get_running_loop() is _shared_loop:
+        yield _shared_client
+    else:
+        async with httpx.AsyncClient() as client:
+            yield client
+
+
 class LLSSService:
     """Service for communicating with LLSS."""
 
@@ -81,7 +124,7 @@ class LLSSService:
         Returns:
             Instance creation response including instance_id
         """
-        async with httpx.AsyncClient() as client:
+        async with _client() as client:
             response = await client.post(
                 f"{self.base_url}/instances",
                 headers=self._get_orchestrator_headers(),
@@ -140,7 +183,7 @@ class LLSSService:
         if full_refresh:
             data["full_refresh"] = "1"
 
-        async with httpx.AsyncClient() as client:
+        async with _client() as client:
             response = await client.post(
                 f"{self.base_url}/instances/{instance_id}/frames",
                 headers=headers,
@@ -160,7 +203,7 @@ class LLSSService:
         Returns:
             True if notification was accepted
         """
-        async with httpx.AsyncClient() as client:
+        async with _client() as client:
             response = await client.post(
                 f"{self.base_url}/instances/{instance_id}/notify",
                 headers=self._get_instance_headers(instance_id),
@@ -170,8 +213,8 @@ class LLSSService:
     async def health_check(self) -> bool:
         """Check if LLSS is reachable."""
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.base_url}/health")
+            async with _client() as client:
+                response = await client.get(f"{self.base_url}/health", timeout=5.0)
                 return response.status_code == 200
         except httpx.RequestError:
             return False
@@ -3,6 +3,7 @@ Renderer service for generating e-Ink display frames.
 """
 
 import hashlib
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from typing import Optional
@@ -21,6 +22,42 @@ from hlss.services.move_selection import MoveSelectionHelper
 from hlss.services.pil_engine import PilEngine
 
 
+@lru_cache(maxsize=256)
+def _replay_game(
+    start_fen: str, uci_moves: str
+) -> tuple[chess.Board, tuple[tuple[int, Optional[str], Optional[str]], ...]]:
+    """Replay a game's UCI moves, returning the final board and SAN move rows.
+
+    Cached on the position and move list: the PLAY screen, its pressed strip
+    and its enabled mask each build the same view, and re-renders of an
+    unchanged game repeat the replay too. The board is shared, so callers
+    must copy it before pushing or popping moves.
+    """
+    board = chess.Board(start_fen)
+    moves: list[tuple[int, Optional[str], Optional[str]]] = []
+    current_move_number = board.fullmove_number
+    white_play: Optional[str] = None
+    black_play: Optional[str] = None
+    for uci in uci_moves.split():
+        move = chess.Move.from_uci(uci)
+        if move not in board.legal_moves:
+            raise ValueError(f"Illegal move {uci} at move {current_move_number}")
+        san = board.san(move)
+        if board.turn == chess.WHITE:
+            white_play = san
+        else:
+            black_play = san
+        board.push(move)
+        if board.turn == chess.WHITE:
+            moves.append((current_move_number, white_play, black_play))
+            current_move_number += 1
+            white_play = None
+            black_play = None
+    if white_play is not None:
+        moves.append((current_move_number, white_play, None))
+    return board, tuple(moves)
+
+
 class RendererService:
     """Service for rendering screens as PNG frames for e-Ink displays."""
 
@@ -498,7 +535,8 @@ class RendererService:
             if (game.initial_fen and game.initial_fen != "startpos")
             else chess.STARTING_FEN
         )
-        board = chess.Board(pos)
+        replayed, move_rows = _replay_game(pos, game.moves or "")
+        board = replayed.copy()
         player_color = chess.WHITE if game.player_color.value == "white" else chess.BLACK
         adversary_color = not player_color
         player_is_white = player_color == chess.WHITE
@@ -513,27 +551,7 @@ class RendererService:
             return 7 - f, r
 
         # ---- move history (plain SAN) + last move ----
-        moves: list[tuple[int, Optional[str], Optional[str]]] = []
-        current_move_number = board.fullmove_number
-        white_play: Optional[str] = None
-        black_play: Optional[str] = None
-        for uci in (game.moves or "").split():
-            move = chess.Move.from_uci(uci)
-            if move not in board.legal_moves:
-                raise ValueError(f"Illegal move {uci} at move {current_move_number}")
-            san = board.san(move)
-            if board.turn == chess.WHITE:
-                white_play = san
-            else:
-                black_play = san
-            board.push(move)
-            if board.turn == chess.WHITE:
-                moves.append((current_move_number, white_play, black_play))
-                current_move_number += 1
-                white_play = None
-                black_play = None
-        if white_play is not None:
-            moves.append((current_move_number, white_play, None))
+        moves = list(move_rows)
 
         from hlss.routers.instances import _deserialize_move_state
 
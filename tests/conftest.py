@@ -2,18 +2,26 @@
 Pytest configuration and fixtures.
 """
 
+import hashlib
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from hlss.database import Base, get_db
+from hlss.database import Base, get_async_db, get_db
 from hlss.main import app
+from hlss.models import Frame, ScreenType
 
 
-# Use in-memory SQLite for testing
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+# Use in-memory SQLite for testing. The database is named and shared-cache so
+# the sync and async (aiosqlite) engines see the same tables.
+SQLALCHEMY_DATABASE_URL = "sqlite:///file:hlss_test?mode=memory&cache=shared&uri=true"
+ASYNC_SQLALCHEMY_DATABASE_URL = (
+    "sqlite+aiosqlite:///file:hlss_test?mode=memory&cache=shared&uri=true"
+)
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
@@ -22,6 +30,11 @@ engine = create_engine(
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URL, poolclass=StaticPool)
+TestingAsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
 
 def override_get_db():
     """Override database dependency for testing."""
@@ -32,6 +45,12 @@ def override_get_db():
         db.close()
 
 
+async def override_get_async_db():
+    """Override async database dependency for testing."""
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+
 @pytest.fixture(scope="function")
 def db_session():
     """Create a fresh database for each test."""
@@ -44,10 +63,27 @@ def db_session():
         Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(scope="function")
+def frame(db_session):
+    """A stored setup-screen frame with fake image data."""
+    image_data = b"\x89PNG fake image"
+    frame = Frame(
+        screen_type=ScreenType.SETUP,
+        image_data=image_data,
+        image_hash=hashlib.sha256(image_data).digest(),
+        width=800,
+        height=480,
+    )
+    db_session.add(frame)
+    db_session.commit()
+    return frame
+
+
 @pytest.fixture(scope="function")
 def client(db_session):
     """Create a test client with database override."""
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     Base.metadata.create_all(bind=engine)
     
     with TestClient(app) as test_client:
@@ -2,7 +2,13 @@
 Tests for API endpoints.
 """
 
+import asyncio
+from datetime import datetime, timedelta
+
 import pytest
+from sqlalchemy import select
+
+from hlss.models import Frame, InputEvent, Instance
 
 
 class TestHealthEndpoint:
@@ -68,6 +74,20 @@ class TestAccountsEndpoints:
         )
         assert response.status_code == 409
 
+    def test_create_default_account_clears_previous_default(self, client):
+        """Test that only the newest default account stays default."""
+        first = client.post(
+            "/api/accounts",
+            json={"username": "first", "api_token": "token1", "is_default": True},
+        ).json()
+        client.post(
+            "/api/accounts",
+            json={"username": "second", "api_token": "token2", "is_default": True},
+        )
+
+        response = client.get(f"/api/accounts/{first['id']}")
+        assert response.json()["is_default"] is False
+
     def test_get_account(self, client):
         """Test getting a specific account."""
         # Create account
@@ -143,3 +163,212 @@ class TestInstancesEndpoints:
         response = client.get("/api/instances")
         assert response.status_code == 200
         assert len(response.json()) == 1
+        assert "link" not in response.headers
+
+    def test_list_instances_pages(self, client, db_session):
+        """Test paging instances by limit and cursor, with a tie at the page boundary."""
+        tie = datetime(2026, 1, 1, 12, 0, 0)
+        created = [tie + timedelta(minutes=1), tie, tie, tie - timedelta(minutes=1)]
+        instances = [
+            Instance(name=f"Instance {i}", created_at=created_at)
+            for i, created_at in enumerate(created)
+        ]
+        db_session.add_all(instances)
+        db_session.commit()
+        tied = sorted((instances[1].id, instances[2].id), reverse=True)
+        expected = [instances[0].id, *tied, instances[3].id]
+
+        response = client.get("/api/instances", params={"limit": 2})
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()] == expected[:2]
+        next_url = response.links["next"]["url"]
+
+        response = client.get(next_url)
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()] == expected[2:]
+
+    def test_list_instances_before_aware(self, client, db_session):
+        """Test that a timezone-aware cursor is compared as UTC."""
+        db_session.add_all(
+            [
+                Instance(name="Old", created_at=datetime(2026, 1, 1, 11, 0, 0)),
+                Instance(name="New", created_at=datetime(2026, 1, 1, 13, 0, 0)),
+            ]
+        )
+        db_session.commit()
+
+        response = client.get("/api/instances", params={"before": "2026-01-01T14:00:00+02:00"})
+        assert response.status_code == 200
+        assert [item["name"] for item in response.json()] == ["Old"]
+
+    def test_list_linked_instances(self, client):
+        """Test listing instances that reference an account (no lazy loads)."""
+        instance_id = client.post(
+            "/api/instances",
+            json={"name": "Test Instance", "type": "chess"},
+        ).json()["id"]
+        account_id = client.post(
+            "/api/accounts",
+            json={"username": "testuser", "api_token": "token1"},
+        ).json()["id"]
+        client.patch(
+            f"/api/instances/by-id/{instance_id}/link-account",
+            params={"account_id": account_id},
+        )
+
+        response = client.get("/api/instances")
+        assert response.status_code == 200
+        assert response.json()[0]["linked_account_id"] == account_id
+
+        response = client.get(f"/api/instances/by-id/{instance_id}")
+        assert response.status_code == 200
+        assert response.json()["current_screen"] == "new_match"
+
+    def test_link_malformed_account_id(self, client):
+        """Test that a malformed account id is rejected instead of stored as NULL."""
+        instance_id = client.post(
+            "/api/instances",
+            json={"name": "Test Instance", "type": "chess"},
+        ).json()["id"]
+
+        response = client.patch(
+            f"/api/instances/by-id/{instance_id}/link-account",
+            params={"account_id": "not-a-uuid"},
+        )
+        assert response.status_code == 404
+
+        response = client.get(f"/api/instances/by-id/{instance_id}")
+        assert response.json()["linked_account_id"] is None
+
+    def test_unchanged_screen_reuses_last_frame(self, client, db_session):
+        """Test that re-rendering an unchanged screen does not store a new frame."""
+        from hlss.routers.instances import _render_frame
+
+        response = client.post(
+            "/api/instances",
+            json={"name": "Test Instance", "type": "chess"},
+        )
+        instance = db_session.get(Instance, response.json()["id"])
+
+        first = _render_frame(instance, db_session)
+        second = _render_frame(instance, db_session)
+
+        assert second.id == first.id
+        assert len(db_session.scalars(select(Frame)).all()) == 1
+
+    def test_background_renders_of_one_instance_do_not_overlap(self, monkeypatch):
+        """Test that a render requested mid-render runs after it, not alongside it."""
+        from hlss.routers import instances
+
+        active: list[str] = []
+        calls: list[str] = []
+        overlaps: list[str] = []
+
+        async def fake_render(instance_id, resubmit=False):
+            # Worker exceptions are logged, not raised, so overlaps are recorded.
+            if instance_id in active:
+                overlaps.append(instance_id)
+            active.append(instance_id)
+            calls.append(instance_id)
+            await asyncio.sleep(0.01)
+            active.remove(instance_id)
+
+        monkeypatch.setattr(instances, "_render_and_submit_frame", fake_render)
+
+        async def scenario():
+            await instances.start_render_workers()
+            try:
+                await instances._schedule_render("a")
+                await asyncio.sleep(0.001)
+                # Both arrive while "a" renders; they fold into one re-render.
+                await instances._schedule_render("a")
+                await instances._schedule_render("a")
+                await instances._render_queue.join()
+            finally:
+                await instances.stop_render_workers()
+
+        asyncio.run(scenario())
+        assert calls == ["a", "a"]
+        assert overlaps == []
+
+
+class TestConfigureEndpoints:
+    """Tests for the web configuration endpoints."""
+
+    def test_configuration_status_unlinked(self, client):
+        """Test polling the status of an instance with no linked account."""
+        instance_id = client.post(
+            "/api/instances",
+            json={"name": "Test Instance", "type": "chess"},
+        ).json()["id"]
+
+        response = client.get(f"/configure/{instance_id}/status")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["instance_id"] == instance_id
+        assert data["linked_account"] is None
+
+    def test_configuration_status_nonexistent(self, client):
+        """Test polling the status of a nonexistent instance."""
+        response = client.get("/configure/nonexistent-id/status")
+        assert response.status_code == 404
+
+
+class TestFramesEndpoints:
+    """Tests for the frames endpoints."""
+
+    def test_frame_image_conditional_get(self, client, frame):
+        """Test that a matching If-None-Match returns 304 without the image."""
+        response = client.get(f"/api/frames/{frame.id}/image")
+        assert response.status_code == 200
+        assert response.content == frame.image_data
+        etag = response.headers["etag"]
+
+        response = client.get(f"/api/frames/{frame.id}/image", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_list_frames(self, client, frame):
+        """Test listing frame metadata."""
+        response = client.get("/api/frames")
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["image_hash"] == frame.image_hash.hex()
+
+    def test_delete_frame(self, client, frame):
+        """Test deleting a frame, then deleting it again."""
+        frame_id = frame.id
+
+        response = client.delete(f"/api/frames/{frame_id}")
+        assert response.status_code == 204
+
+        response = client.delete(f"/api/frames/{frame_id}")
+        assert response.status_code == 404
+
+
+class TestInputsEndpoints:
+    """Tests for the input event endpoints."""
+
+    def test_mark_event_processed(self, client, db_session):
+        """Test marking a stored input event as processed."""
+        create_response = client.post(
+            "/api/inputs",
+            json={"button": "ENTER", "event_type": "PRESS", "timestamp": "2026-01-01T00:00:00"},
+        )
+        assert create_response.status_code == 202
+        event_id = create_response.json()["id"]
+
+        response = client.post(f"/api/inputs/process/{event_id}")
+        assert response.status_code == 200
+        assert response.json()["processed"] is True
+
+        processed_at = db_session.scalar(
+            select(InputEvent.processed_at).where(InputEvent.id == event_id)
+        )
+        assert processed_at is not None
+
+    def test_mark_nonexistent_event_processed(self, client):
+        """Test marking a nonexistent input event as processed."""
+        response = client.post("/api/inputs/process/nonexistent-id")
+        assert response.status_code == 404